@@ -5,66 +5,179 @@ Clean Data Script
 Main script to clean, merge, and prepare air quality data for analysis.
 
 Usage:
-    python clean_data.py
+    python clean_data.py              # Save cleaned data as Parquet
+    python clean_data.py --csv        # Also save legacy CSV copies
+    python clean_data.py --engine polars   # Clean OpenAQ data with Polars
+    python clean_data.py --engine dask     # Clean OpenAQ data out-of-core with Dask
+    python clean_data.py --chunksize       # Filter raw OpenAQ CSV chunk by chunk
 """
 
+import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from typing import Tuple
 
-from src.utils import Logger, save_dataframe_multiple_formats, save_data_dictionary
-from src.data_cleaning import clean_and_merge_data
+from src.utils import (
+    Logger, save_dataframe_multiple_formats, save_data_dictionary,
+    load_csv_with_parquet_cache, save_parquet, is_parquet_cache_fresh
+)
+from src.data_cleaning import clean_and_merge_data, read_openaq_csv_prefiltered
 from src.features import create_all_features
 from src.config import (
     DATA_DIR, CLEANED_DIR, DB_DIR,
     OPENAQ_RAW_CSV, WORLDBANK_RAW_CSV,
+    OPENAQ_RAW_PARQUET, WORLDBANK_RAW_PARQUET,
+    OPENAQ_RAW_COLUMNS, OPENAQ_RAW_DTYPES, OPENAQ_CSV_CHUNKSIZE,
     OPENAQ_CLEANED_CSV, WORLDBANK_CLEANED_CSV,
-    ANALYSIS_READY_CSV, MERGED_COMPLETE_CSV
+    ANALYSIS_READY_CSV, MERGED_COMPLETE_CSV,
+    OPENAQ_CLEANED_PARQUET, WORLDBANK_CLEANED_PARQUET,
+    ANALYSIS_READY_PARQUET, MERGED_COMPLETE_PARQUET
 )
 import pandas as pd
 
 
-def load_raw_data(logger: Logger):
-    """Load raw data files."""
+def load_raw_data(logger: Logger, engine: str = 'pandas', chunksize: int = None):
+    """
+    Load raw data files.
+
+    With the Polars and Dask engines, OpenAQ data is returned lazily and only
+    read when the cleaning runs. With a chunksize, the pandas engine reads the
+    raw OpenAQ CSV in chunks and drops invalid rows from each chunk; a fresh
+    Parquet copy of the raw data (one not older than the CSV) is read whole.
+    """
     logger.log("=" * 80)
     logger.log("LOADING RAW DATA")
     logger.log("=" * 80)
 
-    df_openaq = pd.read_csv(DATA_DIR / OPENAQ_RAW_CSV)
-    df_wb = pd.read_csv(DATA_DIR / WORLDBANK_RAW_CSV)
+    if engine == 'polars':
+        from src.data_cleaning_polars import scan_openaq_raw
+        df_openaq = scan_openaq_raw(DATA_DIR / OPENAQ_RAW_CSV, DATA_DIR / OPENAQ_RAW_PARQUET)
+        logger.log("✓ Scanning OpenAQ lazily (Polars)")
+    elif engine == 'dask':
+        from src.data_cleaning_dask import read_openaq_raw
+        df_openaq = read_openaq_raw(DATA_DIR / OPENAQ_RAW_CSV, DATA_DIR / OPENAQ_RAW_PARQUET)
+        logger.log(f"✓ Reading OpenAQ in {df_openaq.npartitions:,} partitions (Dask)")
+    elif chunksize and not is_parquet_cache_fresh(DATA_DIR / OPENAQ_RAW_CSV, DATA_DIR / OPENAQ_RAW_PARQUET):
+        df_openaq = read_openaq_csv_prefiltered(
+            DATA_DIR / OPENAQ_RAW_CSV,
+            chunksize,
+            dtype=OPENAQ_RAW_DTYPES,
+            usecols=OPENAQ_RAW_COLUMNS,
+            parse_dates=['datetime']
+        )
+        prefilter_stats = df_openaq.attrs['prefilter_stats']
+        logger.log(f"✓ Loaded OpenAQ: {len(df_openaq):,} of {prefilter_stats['initial']:,} records kept while reading")
+    else:
+        df_openaq = load_csv_with_parquet_cache(
+            DATA_DIR / OPENAQ_RAW_CSV,
+            DATA_DIR / OPENAQ_RAW_PARQUET,
+            dtype=OPENAQ_RAW_DTYPES,
+            usecols=OPENAQ_RAW_COLUMNS,
+            parse_dates=['datetime']
+        )
+        logger.log(f"✓ Loaded OpenAQ: {len(df_openaq):,} records")
 
-    logger.log(f"✓ Loaded OpenAQ: {len(df_openaq):,} records")
+    df_wb = load_csv_with_parquet_cache(DATA_DIR / WORLDBANK_RAW_CSV, DATA_DIR / WORLDBANK_RAW_PARQUET)
     logger.log(f"✓ Loaded World Bank: {len(df_wb):,} records")
     logger.log("")
 
     return df_openaq, df_wb
 
 
+def save_dataset(
+    df: pd.DataFrame,
+    parquet_name: str,
+    csv_name: str,
+    logger: Logger,
+    write_csv: bool = False,
+    note: str = ''
+) -> Path:
+    """
+    Save a cleaned dataset as Parquet, with an optional CSV copy.
+
+    Falls back to CSV when pyarrow is not available.
+
+    Args:
+        df: DataFrame to save
+        parquet_name: Parquet file name in CLEANED_DIR
+        csv_name: CSV file name in CLEANED_DIR
+        logger: Logger instance
+        write_csv: Whether to also write the CSV file
+        note: Optional note appended to the log message
+
+    Returns:
+        Path of the primary saved file
+    """
+    primary_path = CLEANED_DIR / parquet_name
+    saved_paths = []
+
+    if save_parquet(df, primary_path):
+        saved_paths.append(primary_path)
+    else:
+        primary_path = CLEANED_DIR / csv_name
+        write_csv = True
+
+    if write_csv:
+        df.to_csv(CLEANED_DIR / csv_name, index=False)
+        saved_paths.append(CLEANED_DIR / csv_name)
+
+    for path in saved_paths:
+        logger.log(f"✓ Saved: {path}{note}")
+
+    return primary_path
+
+
+def save_dataset_deferred(
+    df: pd.DataFrame,
+    parquet_name: str,
+    csv_name: str,
+    write_csv: bool = False
+) -> Logger:
+    """Save a dataset (see save_dataset) and return a deferred logger holding its messages."""
+    deferred_logger = Logger(defer_console=True)
+    save_dataset(df, parquet_name, csv_name, deferred_logger, write_csv)
+    return deferred_logger
+
+
 def save_cleaned_data(
     df_openaq_clean,
     df_wb_clean,
     df_analysis,
     df_merged_full,
-    logger: Logger
-):
-    """Save all cleaned datasets."""
+    logger: Logger,
+    io_executor: ThreadPoolExecutor,
+    write_csv: bool = False
+) -> Tuple[Path, Future]:
+    """
+    Save all cleaned datasets.
+
+    The full merged dataset is for reference only, so it is written on
+    io_executor while the rest of the pipeline continues.
+
+    Returns:
+        Tuple of (analysis-ready file path, future of the merged dataset's logger)
+    """
     logger.log("=" * 80)
     logger.log("SAVING CLEANED DATA")
     logger.log("=" * 80)
 
     # 1. Cleaned OpenAQ (detailed records)
-    df_openaq_clean.to_csv(CLEANED_DIR / OPENAQ_CLEANED_CSV, index=False)
-    logger.log(f"✓ Saved: {CLEANED_DIR / OPENAQ_CLEANED_CSV}")
+    save_dataset(df_openaq_clean, OPENAQ_CLEANED_PARQUET, OPENAQ_CLEANED_CSV, logger, write_csv)
 
     # 2. Cleaned World Bank
-    df_wb_clean.to_csv(CLEANED_DIR / WORLDBANK_CLEANED_CSV, index=False)
-    logger.log(f"✓ Saved: {CLEANED_DIR / WORLDBANK_CLEANED_CSV}")
+    save_dataset(df_wb_clean, WORLDBANK_CLEANED_PARQUET, WORLDBANK_CLEANED_CSV, logger, write_csv)
 
     # 3. Analysis-ready dataset (merged, with derived features)
-    df_analysis.to_csv(CLEANED_DIR / ANALYSIS_READY_CSV, index=False)
-    logger.log(f"✓ Saved: {CLEANED_DIR / ANALYSIS_READY_CSV} (PRIMARY DATASET FOR ANALYSIS)")
+    analysis_path = save_dataset(
+        df_analysis, ANALYSIS_READY_PARQUET, ANALYSIS_READY_CSV, logger, write_csv,
+        note=" (PRIMARY DATASET FOR ANALYSIS)"
+    )
 
-    # 4. Full merged dataset (includes unmatched records)
-    df_merged_full.to_csv(CLEANED_DIR / MERGED_COMPLETE_CSV, index=False)
-    logger.log(f"✓ Saved: {CLEANED_DIR / MERGED_COMPLETE_CSV}")
+    # 4. Full merged dataset (includes unmatched records), in the background
+    merged_write = io_executor.submit(
+        save_dataset_deferred, df_merged_full, MERGED_COMPLETE_PARQUET, MERGED_COMPLETE_CSV, write_csv
+    )
 
     # 5. Save data dictionaries
     save_data_dictionary(df_openaq_clean, 'openaq', DB_DIR)
@@ -78,6 +191,8 @@ def save_cleaned_data(
 
     logger.log("")
 
+    return analysis_path, merged_write
+
 
 def print_summary(df_analysis, openaq_stats, wb_stats, logger: Logger):
     """Print summary statistics."""
@@ -113,6 +228,29 @@ def print_summary(df_analysis, openaq_stats, wb_stats, logger: Logger):
 
 def main():
     """Main execution function."""
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Clean and merge air quality data')
+    parser.add_argument(
+        '--csv',
+        action='store_true',
+        help='Also save cleaned datasets as CSV (legacy format)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=['pandas', 'polars', 'dask'],
+        default='pandas',
+        help='DataFrame engine for OpenAQ cleaning and aggregation'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        nargs='?',
+        const=OPENAQ_CSV_CHUNKSIZE,
+        help=f'Read raw OpenAQ CSV in chunks of this many rows (default {OPENAQ_CSV_CHUNKSIZE:,}), '
+             'dropping invalid rows per chunk to lower peak memory (pandas engine)'
+    )
+    args = parser.parse_args()
+
     # Initialize logger
     logger = Logger(print_to_console=True)
     start_time = datetime.now()
@@ -126,9 +264,15 @@ def main():
 
     try:
         # Load raw data
-        df_openaq_raw, df_wb_raw = load_raw_data(logger)
+        df_openaq_raw, df_wb_raw = load_raw_data(logger, engine=args.engine, chunksize=args.chunksize)
 
         # Clean and merge data
+        if args.engine == 'polars':
+            from src.data_cleaning_polars import clean_and_merge_data as clean_fn
+        elif args.engine == 'dask':
+            from src.data_cleaning_dask import clean_and_merge_data as clean_fn
+        else:
+            clean_fn = clean_and_merge_data
         (
             df_openaq_clean,
             df_wb_clean,
@@ -136,22 +280,28 @@ def main():
             df_merged_full,
             openaq_stats,
             wb_stats
-        ) = clean_and_merge_data(df_openaq_raw, df_wb_raw, logger)
+        ) = clean_fn(df_openaq_raw, df_wb_raw, logger)
 
         # Create derived features
         df_analysis = create_all_features(df_analysis, logger)
 
-        # Save cleaned data
-        save_cleaned_data(
-            df_openaq_clean,
-            df_wb_clean,
-            df_analysis,
-            df_merged_full,
-            logger
-        )
+        with ThreadPoolExecutor(max_workers=1) as io_executor:
+            # Save cleaned data
+            analysis_path, merged_write = save_cleaned_data(
+                df_openaq_clean,
+                df_wb_clean,
+                df_analysis,
+                df_merged_full,
+                logger,
+                io_executor,
+                write_csv=args.csv
+            )
+
+            # Print summary
+            print_summary(df_analysis, openaq_stats, wb_stats, logger)
 
-        # Print summary
-        print_summary(df_analysis, openaq_stats, wb_stats, logger)
+            # Wait for the merged dataset (re-raises any write error)
+            logger.merge(merged_write.result())
 
         # Final summary
         end_time = datetime.now()
@@ -164,7 +314,7 @@ def main():
         logger.log(f"Duration: {duration:.2f} seconds")
         logger.log("")
         logger.log("Next Steps:")
-        logger.log(f"  1. Use: {CLEANED_DIR / ANALYSIS_READY_CSV} for analysis")
+        logger.log(f"  1. Use: {analysis_path} for analysis")
         logger.log(f"  2. Check: {CLEANED_DIR / 'data_dictionary.json'} for column details")
         logger.log("  3. Start visualization or statistical analysis")
         logger.log("=" * 80)
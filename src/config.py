@@ -6,6 +6,7 @@ Centralized configuration makes it easy to modify settings.
 """
 
 import os
+from importlib.util import find_spec
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -94,6 +95,19 @@ ITEMS_PER_PAGE = 1000
 REQUEST_TIMEOUT = 30  # seconds
 REQUEST_DELAY = 0.5  # seconds between requests
 
+# Connection pooling and retries for the shared HTTP session
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+REQUEST_RETRIES = 5
+REQUEST_BACKOFF_FACTOR = 0.5  # seconds, doubled on each retry
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Send OpenAQ requests over HTTP/2 when httpx[http2] is installed
+OPENAQ_HTTP2 = True
+
+# OpenAQ parameters fetched concurrently (REQUEST_DELAY still spaces all requests)
+OPENAQ_FETCH_WORKERS = 4
+
 # ============================================================================
 # DATA CATEGORIZATION THRESHOLDS
 # ============================================================================
@@ -120,12 +134,59 @@ OPENAQ_RAW_JSON = 'openaq_raw.json'
 WORLDBANK_RAW_CSV = 'worldbank_raw.csv'
 WORLDBANK_RAW_JSON = 'worldbank_raw.json'
 
+# Free-text columns use Arrow-backed strings when pyarrow is installed
+TEXT_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') else 'string'
+
+# Raw OpenAQ columns (in file order) and their dtypes; 'datetime' is parsed separately
+OPENAQ_RAW_COLUMNS = [
+    'parameter', 'value', 'location_id', 'location_name', 'country_code', 'country',
+    'city', 'latitude', 'longitude', 'datetime', 'sensors_id'
+]
+OPENAQ_RAW_DTYPES = {
+    'parameter': 'category',
+    'value': 'float32',
+    'location_id': 'Int32',
+    'location_name': TEXT_DTYPE,
+    'country_code': 'category',
+    'country': 'category',
+    'city': TEXT_DTYPE,
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'sensors_id': 'Int64'
+}
+
+# Raw data Parquet files, written by fetch_data.py (rebuilt from a newer legacy CSV)
+OPENAQ_RAW_PARQUET = 'openaq_raw.parquet'
+WORLDBANK_RAW_PARQUET = 'worldbank_raw.parquet'
+
+# Also dump raw data as JSON (for inspection only; not read by the pipeline)
+DEBUG_JSON_DUMP = False
+
+# Per-parameter OpenAQ location lookups, refetched once older than the max age
+OPENAQ_LOCATIONS_PARQUET = 'openaq_locations_{parameter_id}.parquet'
+OPENAQ_LOCATIONS_MAX_AGE_DAYS = 7
+
+# Rows per chunk for clean_data.py --chunksize (filtered while reading)
+OPENAQ_CSV_CHUNKSIZE = 500_000
+
+# Partition size when reading raw OpenAQ data out-of-core (Dask engine)
+DASK_BLOCKSIZE = '64MB'
+
 # Cleaned data files
 OPENAQ_CLEANED_CSV = 'openaq_cleaned.csv'
 WORLDBANK_CLEANED_CSV = 'worldbank_cleaned.csv'
 ANALYSIS_READY_CSV = 'analysis_ready.csv'
 MERGED_COMPLETE_CSV = 'merged_complete.csv'
 
+# Cleaned data files (columnar, default output format)
+OPENAQ_CLEANED_PARQUET = 'openaq_cleaned.parquet'
+WORLDBANK_CLEANED_PARQUET = 'worldbank_cleaned.parquet'
+ANALYSIS_READY_PARQUET = 'analysis_ready.parquet'
+MERGED_COMPLETE_PARQUET = 'merged_complete.parquet'
+PARQUET_COMPRESSION = 'snappy'
+# Rows converted and written per Parquet row group
+PARQUET_ROW_GROUP_SIZE = 50_000
+
 # Database-ready files
 OPENAQ_DB_CSV = 'openaq_db_ready.csv'
 OPENAQ_DB_PARQUET = 'openaq_db_ready.parquet'
@@ -6,6 +6,8 @@ Cleans, validates, and merges OpenAQ and World Bank datasets.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from pandas.api.types import is_datetime64_any_dtype, union_categoricals
 from typing import Dict, Tuple
 
 from src.config import (
@@ -13,13 +15,114 @@ from src.config import (
     EXCLUDED_WB_CODES, INCOME_BINS, INCOME_LABELS,
     URBANIZATION_BINS, URBANIZATION_LABELS
 )
-from src.utils import Logger, get_iso_country_code_mapping
+from src.utils import Logger, map_iso2_to_iso3
 
 
 # ============================================================================
 # OPENAQ DATA CLEANING
 # ============================================================================
 
+def get_parameter_bounds(parameter: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the valid value range for each row's parameter.
+
+    The threshold lookup runs once per category instead of once per row.
+    Parameters without configured thresholds are unbounded.
+
+    Args:
+        parameter: Series of parameter names
+
+    Returns:
+        Tuple of (min_values, max_values) arrays aligned with the rows
+    """
+    parameter = parameter.astype('category')
+    min_values = parameter.map({param: t['min'] for param, t in PARAMETER_THRESHOLDS.items()})
+    max_values = parameter.map({param: t['max'] for param, t in PARAMETER_THRESHOLDS.items()})
+
+    return (
+        min_values.to_numpy(dtype=np.float64, na_value=-np.inf),
+        max_values.to_numpy(dtype=np.float64, na_value=np.inf)
+    )
+
+
+def get_openaq_removal_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flag rows removed by the unknown-country, coordinate and value filters.
+
+    Each row is attributed to the first of these filters that removes it,
+    matching steps 1-3 of clean_openaq_data.
+
+    Args:
+        df: Raw OpenAQ DataFrame
+
+    Returns:
+        DataFrame of boolean flags (unknown_country, invalid_coordinates,
+        invalid_value) aligned with df
+    """
+    unknown = (df['country'] == 'Unknown').to_numpy(dtype=bool)
+    coords_ok = (
+        ((df['latitude'].isna()) | ((df['latitude'] >= LAT_MIN) & (df['latitude'] <= LAT_MAX))) &
+        ((df['longitude'].isna()) | ((df['longitude'] >= LON_MIN) & (df['longitude'] <= LON_MAX)))
+    ).to_numpy(dtype=bool)
+    min_values, max_values = get_parameter_bounds(df['parameter'])
+    value = df['value'].to_numpy(dtype=np.float64, na_value=np.nan)
+    value_ok = ~((value < min_values) | (value > max_values))
+
+    return pd.DataFrame({
+        'unknown_country': unknown,
+        'invalid_coordinates': ~unknown & ~coords_ok,
+        'invalid_value': ~unknown & coords_ok & ~value_ok
+    }, index=df.index)
+
+
+def read_openaq_csv_prefiltered(csv_path, chunksize: int, **kwargs) -> pd.DataFrame:
+    """
+    Read raw OpenAQ CSV in chunks, keeping only rows that pass steps 1-3.
+
+    Rows with unknown countries, invalid coordinates or invalid values are
+    dropped chunk by chunk, so peak memory holds one raw chunk plus the
+    survivors. The removal counts are stored in df.attrs['prefilter_stats']
+    and included in the statistics reported by clean_openaq_data.
+
+    Args:
+        csv_path: Path to raw CSV file
+        chunksize: Number of rows per chunk
+        **kwargs: Additional arguments for pd.read_csv
+
+    Returns:
+        Pre-filtered OpenAQ DataFrame
+    """
+    prefilter_stats = {
+        'initial': 0,
+        'removed_unknown_countries': 0,
+        'removed_invalid_coordinates': 0,
+        'removed_invalid_values': 0,
+        'invalid_values_per_parameter': {}
+    }
+    invalid_per_param = prefilter_stats['invalid_values_per_parameter']
+
+    chunks = []
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, engine='c', **kwargs):
+        flags = get_openaq_removal_flags(chunk)
+        invalid_mask = flags['invalid_value'].to_numpy()
+        for param, invalid_count in chunk['parameter'][invalid_mask].value_counts().items():
+            invalid_per_param[param] = invalid_per_param.get(param, 0) + int(invalid_count)
+
+        prefilter_stats['initial'] += len(chunk)
+        prefilter_stats['removed_unknown_countries'] += int(flags['unknown_country'].sum())
+        prefilter_stats['removed_invalid_coordinates'] += int(flags['invalid_coordinates'].sum())
+        prefilter_stats['removed_invalid_values'] += int(invalid_mask.sum())
+        chunks.append(chunk[~flags.any(axis=1).to_numpy()])
+
+    df = pd.concat(chunks, ignore_index=True)
+    # Chunks have different categories; restore the requested dtypes once
+    if 'dtype' in kwargs:
+        df = df.astype(kwargs['dtype'])
+    df.attrs['prefilter_stats'] = prefilter_stats
+
+    return df
+
+
 def clean_openaq_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, Dict]:
     """
     Comprehensive cleaning of OpenAQ data.
@@ -35,7 +138,10 @@ def clean_openaq_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, D
     logger.log("CLEANING OPENAQ DATA")
     logger.log("=" * 80)
 
-    initial_count = len(df)
+    # Rows already dropped while reading (see read_openaq_csv_prefiltered)
+    prefilter_stats = df.attrs.get('prefilter_stats', {})
+
+    initial_count = prefilter_stats.get('initial', len(df))
     logger.log(f"Initial records: {initial_count:,}")
     logger.log("")
 
@@ -49,56 +155,65 @@ def clean_openaq_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, D
         'final': 0
     }
 
+    # Steps 1-3 only build boolean masks; the frame is filtered once at the end
     # 1. Remove records with Unknown country (46.91% of data - critical issue)
     logger.log("STEP 1: Removing Unknown countries...")
-    unknown_mask = df['country'] == 'Unknown'
-    unknown_count = unknown_mask.sum()
-    df = df[~unknown_mask].copy()
+    flags = get_openaq_removal_flags(df)
+    unknown_mask = flags['unknown_country'].to_numpy()
+    unknown_count = int(unknown_mask.sum()) + prefilter_stats.get('removed_unknown_countries', 0)
+    keep = ~unknown_mask
+    remaining = initial_count - unknown_count
     cleaning_stats['removed_unknown_countries'] = unknown_count
     logger.log(f"   Removed {unknown_count:,} records with Unknown country ({unknown_count/initial_count*100:.2f}%)")
-    logger.log(f"   Remaining: {len(df):,} records")
+    logger.log(f"   Remaining: {remaining:,} records")
     logger.log("")
 
     # 2. Remove invalid coordinates
     logger.log("STEP 2: Removing invalid coordinates...")
-    before = len(df)
-    df = df[
-        ((df['latitude'].isna()) | ((df['latitude'] >= LAT_MIN) & (df['latitude'] <= LAT_MAX))) &
-        ((df['longitude'].isna()) | ((df['longitude'] >= LON_MIN) & (df['longitude'] <= LON_MAX)))
-    ].copy()
-    invalid_coords = before - len(df)
+    invalid_coords_mask = flags['invalid_coordinates'].to_numpy()
+    invalid_coords = int(invalid_coords_mask.sum()) + prefilter_stats.get('removed_invalid_coordinates', 0)
+    keep &= ~invalid_coords_mask
+    remaining -= invalid_coords
     cleaning_stats['removed_invalid_coordinates'] = invalid_coords
     logger.log(f"   Removed {invalid_coords:,} records with invalid coordinates")
-    logger.log(f"   Remaining: {len(df):,} records")
+    logger.log(f"   Remaining: {remaining:,} records")
     logger.log("")
 
     # 3. Remove invalid measurement values (parameter-specific)
     logger.log("STEP 3: Removing invalid measurement values...")
-    before = len(df)
 
-    for param, thresholds in PARAMETER_THRESHOLDS.items():
-        param_mask = df['parameter'] == param
-        invalid_mask = param_mask & (
-            (df['value'] < thresholds['min']) |
-            (df['value'] > thresholds['max'])
-        )
-        invalid_count = invalid_mask.sum()
+    invalid_mask = flags['invalid_value'].to_numpy()
 
+    invalid_per_param = df['parameter'][invalid_mask].value_counts(sort=False).to_dict()
+    for param, invalid_count in prefilter_stats.get('invalid_values_per_parameter', {}).items():
+        invalid_per_param[param] = invalid_per_param.get(param, 0) + invalid_count
+    for param, invalid_count in invalid_per_param.items():
         if invalid_count > 0:
-            logger.log(f"   Removing {invalid_count:,} invalid {param} values (outside {thresholds['min']}-{thresholds['max']} {thresholds['unit']})")
-            df = df[~invalid_mask].copy()
+            limits = PARAMETER_THRESHOLDS[param]
+            logger.log(f"   Removing {invalid_count:,} invalid {param} values (outside {limits['min']}-{limits['max']} {limits['unit']})")
 
-    total_invalid = before - len(df)
+    total_invalid = int(invalid_mask.sum()) + prefilter_stats.get('removed_invalid_values', 0)
+    keep &= ~invalid_mask
+    remaining -= total_invalid
     cleaning_stats['removed_invalid_values'] = total_invalid
     logger.log(f"  Total invalid values removed: {total_invalid:,}")
-    logger.log(f"   Remaining: {len(df):,} records")
+    logger.log(f"   Remaining: {remaining:,} records")
     logger.log("")
 
-    # 4. Remove duplicates
+    # 4. Remove duplicates (among the rows kept so far; datetimes hash as int64)
     logger.log("STEP 4: Removing duplicates...")
-    before = len(df)
-    df = df.drop_duplicates(subset=['parameter', 'location_id', 'datetime', 'value']).copy()
-    duplicates = before - len(df)
+    # Usually parsed at load (parse_dates); only unparsed input is converted here
+    if not is_datetime64_any_dtype(df['datetime']):
+        df = df.assign(datetime=pd.to_datetime(df['datetime'], errors='coerce'))
+    dedup_keys = df.loc[keep, ['parameter', 'location_id', 'datetime', 'value']]
+    duplicate_mask = np.zeros(len(df), dtype=bool)
+    duplicate_mask[keep] = dedup_keys.duplicated().to_numpy()
+    duplicates = int(duplicate_mask.sum())
+    keep &= ~duplicate_mask
+    # take() gathers the surviving rows into a new frame once; no extra copy is
+    # needed before the columns below are added
+    df = df.take(np.flatnonzero(keep))
+    df.attrs.pop('prefilter_stats', None)
     cleaning_stats['removed_duplicates'] = duplicates
     logger.log(f"   Removed {duplicates:,} duplicate records")
     logger.log(f"   Remaining: {len(df):,} records")
@@ -106,17 +221,23 @@ def clean_openaq_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, D
 
     # 5. Add datetime components
     logger.log("STEP 5: Extracting datetime components...")
-    df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
-    df['measurement_year'] = df['datetime'].dt.year
-    df['measurement_month'] = df['datetime'].dt.month
-    df['measurement_hour'] = df['datetime'].dt.hour
+    # One view of the UTC datetime64 values; the three fields are integer
+    # arithmetic on it, and NaT becomes <NA>
+    stamps = df['datetime'].to_numpy(dtype='datetime64[ns]')
+    missing = np.isnat(stamps)
+    months = stamps.astype('datetime64[M]').astype(np.int64)
+    hours = stamps.astype('datetime64[h]').astype(np.int64)
+    df['measurement_year'] = pd.arrays.IntegerArray((months // 12 + 1970).astype(np.int16), missing)
+    df['measurement_month'] = pd.arrays.IntegerArray((months % 12 + 1).astype(np.int8), missing)
+    df['measurement_hour'] = pd.arrays.IntegerArray((hours % 24).astype(np.int8), missing)
     logger.log(f"   Added year, month, hour columns")
     logger.log("")
 
     # 6. Create data quality flags
     logger.log("STEP 6: Creating data quality flags...")
     df['has_coordinates'] = df['latitude'].notna() & df['longitude'].notna()
-    df['has_city'] = (df['city'] != 'Unknown') & df['city'].notna()
+    # Missing cities compare as <NA> on string columns; count them as False
+    df['has_city'] = (df['city'] != 'Unknown').to_numpy(dtype=bool, na_value=False) & df['city'].notna().to_numpy()
     logger.log(f"   Added quality flag columns")
     logger.log("")
 
@@ -140,6 +261,28 @@ def clean_openaq_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, D
 # WORLD BANK DATA CLEANING
 # ============================================================================
 
+def bin_to_categorical(values: pd.Series, bins: list, labels: list) -> pd.Categorical:
+    """
+    Assign values to right-closed bins, like pd.cut(values, bins, labels=labels).
+
+    Uses a binary search over the bin edges and builds the categorical
+    directly from the resulting codes.
+
+    Args:
+        values: Numeric values to bin
+        bins: Monotonically increasing bin edges
+        labels: One label per bin
+
+    Returns:
+        Categorical of bin labels (NaN outside the bins or for missing values)
+    """
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes = np.searchsorted(np.asarray(bins, dtype=np.float64), values, side='left') - 1
+    codes[(codes < 0) | (codes >= len(labels))] = -1
+
+    return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(labels, ordered=True))
+
+
 def clean_world_bank_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, Dict]:
     """
     Clean World Bank data.
@@ -166,22 +309,27 @@ def clean_world_bank_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFram
         'final': 0
     }
 
+    # Steps 1-2 only build boolean masks; the frame is filtered once at the end
     # 1. Remove regional/aggregate codes (not actual countries)
     logger.log("STEP 1: Removing regional aggregates...")
-    before = len(df)
-    df = df[~df['country_code'].isin(EXCLUDED_WB_CODES)].copy()
-    removed = before - len(df)
+    # Test each distinct code once, then gather by category code; the appended
+    # False keeps missing codes (category code -1)
+    country_codes = df['country_code'].astype('category')
+    excluded = np.append(country_codes.cat.categories.isin(EXCLUDED_WB_CODES), False)
+    keep = ~excluded[country_codes.cat.codes.to_numpy()]
+    removed = initial_count - int(keep.sum())
     cleaning_stats['removed_regional_aggregates'] = removed
     logger.log(f"   Removed {removed:,} regional aggregate records")
-    logger.log(f"   Remaining: {len(df):,} records")
+    logger.log(f"   Remaining: {int(keep.sum()):,} records")
     logger.log("")
 
     # 2. Remove records where ALL indicators are null
     logger.log("STEP 2: Removing records with all null indicators...")
-    before = len(df)
     indicator_cols = ['pm25_exposure', 'gdp_per_capita', 'urban_population_pct']
-    df = df[df[indicator_cols].notna().any(axis=1)].copy()
-    removed = before - len(df)
+    all_null = keep & ~df[indicator_cols].notna().any(axis=1).to_numpy()
+    removed = int(all_null.sum())
+    keep &= ~all_null
+    df = df.take(np.flatnonzero(keep))
     cleaning_stats['removed_all_null'] = removed
     logger.log(f"   Removed {removed:,} records with all null indicators")
     logger.log(f"   Remaining: {len(df):,} records")
@@ -191,14 +339,14 @@ def clean_world_bank_data(df: pd.DataFrame, logger: Logger) -> Tuple[pd.DataFram
     logger.log("STEP 3: Creating derived columns...")
 
     # Income category based on GDP per capita (World Bank classification)
-    df['income_category'] = pd.cut(
+    df['income_category'] = bin_to_categorical(
         df['gdp_per_capita'],
         bins=INCOME_BINS,
         labels=INCOME_LABELS
     )
 
     # Urbanization category
-    df['urbanization_level'] = pd.cut(
+    df['urbanization_level'] = bin_to_categorical(
         df['urban_population_pct'],
         bins=URBANIZATION_BINS,
         labels=URBANIZATION_LABELS
@@ -241,42 +389,23 @@ def aggregate_openaq_by_country(df: pd.DataFrame, logger: Logger) -> pd.DataFram
     logger.log("AGGREGATING OPENAQ DATA BY COUNTRY")
     logger.log("=" * 80)
 
-    # Create aggregation for each parameter
-    agg_dict = {
-        'value': ['mean', 'median', 'std', 'min', 'max', 'count'],
-        'has_coordinates': 'mean',
-        'location_id': 'nunique'
-    }
+    # Aggregate by country and parameter on categorical keys, so the groupby hashes
+    # small integer codes (observed=True: only combinations present in the data)
+    group_keys = [df[col].astype('category') for col in ['country', 'country_code', 'parameter']]
+    df_agg = df.groupby(group_keys, observed=True, sort=False).agg(
+        mean_value=('value', 'mean'),
+        median_value=('value', 'median'),
+        measurement_count=('value', 'count'),
+        num_locations=('location_id', 'nunique')
+    )
+
+    # Unstack to get one row per country with columns for each parameter
+    df_pivot = df_agg.unstack('parameter').sort_index(axis=1)
+    df_pivot.columns = df_pivot.columns.map('_'.join)
+    df_pivot = df_pivot.reset_index()
 
-    # Aggregate by country and parameter
-    df_agg = df.groupby(['country', 'country_code', 'parameter']).agg(agg_dict).reset_index()
-
-    # Flatten column names
-    df_agg.columns = ['_'.join(col).strip('_') if col[1] else col[0]
-                      for col in df_agg.columns.values]
-
-    # Rename for clarity
-    df_agg.rename(columns={
-        'value_mean': 'mean_value',
-        'value_median': 'median_value',
-        'value_std': 'std_value',
-        'value_min': 'min_value',
-        'value_max': 'max_value',
-        'value_count': 'measurement_count',
-        'has_coordinates_mean': 'coordinate_completeness',
-        'location_id_nunique': 'num_locations'
-    }, inplace=True)
-
-    # Pivot to get one row per country with columns for each parameter
-    df_pivot = df_agg.pivot_table(
-        index=['country', 'country_code'],
-        columns='parameter',
-        values=['mean_value', 'median_value', 'measurement_count', 'num_locations']
-    ).reset_index()
-
-    # Flatten column names
-    df_pivot.columns = ['_'.join([str(c) for c in col]).strip('_') if col[1] else col[0]
-                        for col in df_pivot.columns.values]
+    # Categorical keys become plain strings so they can be merged and filled freely
+    df_pivot = df_pivot.astype({'country': str, 'country_code': str})
 
     logger.log(f" Aggregated to {len(df_pivot):,} countries")
     logger.log(f"  Columns created: {len(df_pivot.columns)}")
@@ -309,39 +438,43 @@ def merge_datasets(
     logger.log("MERGING DATASETS")
     logger.log("=" * 80)
 
-    # Get country code mapping (2-letter to 3-letter)
-    iso_mapping = get_iso_country_code_mapping()
-
     # Convert OpenAQ 2-letter codes to 3-letter codes
-    logger.log("Converting OpenAQ country codes (2-letter  3-letter)...")
-    df_openaq_agg['country_code_3'] = df_openaq_agg['country_code'].map(iso_mapping)
+    logger.log("Converting OpenAQ country codes (2-letter → 3-letter)...")
+    # The mapping is looked up once per distinct code, not once per row
+    country_code_2 = df_openaq_agg['country_code'].astype('category')
+    categories_2 = country_code_2.cat.categories
+    categories_3 = map_iso2_to_iso3(categories_2)
+    is_mapped = np.append(categories_3 != categories_2.to_numpy(dtype=str), False)
 
     # Count how many codes were successfully converted
-    converted = df_openaq_agg['country_code_3'].notna().sum()
+    converted = int(is_mapped[country_code_2.cat.codes.to_numpy()].sum())
     total = len(df_openaq_agg)
     logger.log(f"  Converted {converted}/{total} country codes")
 
     # Show unmapped codes
-    unmapped = df_openaq_agg[df_openaq_agg['country_code_3'].isna()]
+    unmapped = categories_2[~is_mapped[:-1]]
     if len(unmapped) > 0:
-        logger.log(f"   Unmapped codes: {unmapped['country_code'].unique().tolist()}")
+        logger.log(f"  ⚠ Unmapped codes: {unmapped.tolist()}")
 
-    # Use 3-letter code for merging, and keep original 2-letter code
+    # Use 3-letter code for merging (unmapped codes stay as-is), and keep original 2-letter code
     df_openaq_agg['country_code_2'] = df_openaq_agg['country_code']  # Keep original 2-letter
-    df_openaq_agg['country_code'] = df_openaq_agg['country_code_3'].fillna(df_openaq_agg['country_code_2'])  # Use 3-letter for merging
-
-    # Drop temporary columns
-    df_openaq_agg.drop(columns=['country_code_3'], inplace=True)
+    df_openaq_agg['country_code'] = country_code_2.cat.rename_categories(categories_3.tolist())
 
     logger.log("")
 
-    # Try merging on converted country_code
+    # Try merging on converted country_code; both sides share one categorical
+    # dtype so the join hashes integer codes instead of strings
     logger.log("Merging datasets on country_code...")
+    code_dtype = union_categoricals([
+        pd.Categorical(df_openaq_agg['country_code']),
+        pd.Categorical(df_wb['country_code'])
+    ], sort_categories=True).dtype
     df_merged = pd.merge(
-        df_openaq_agg,
-        df_wb,
+        df_openaq_agg.astype({'country_code': code_dtype}),
+        df_wb.astype({'country_code': code_dtype}),
         on='country_code',
         how='outer',
+        sort=False,
         suffixes=('_openaq', '_wb'),
         indicator=True
     )
@@ -358,12 +491,13 @@ def merge_datasets(
     logger.log("")
 
     # Keep only records that exist in both datasets for primary analysis
-    df_analysis = df_merged[df_merged['_merge'] == 'both'].copy()
+    # (drop() returns a new frame, so no separate copy is needed)
+    df_analysis = df_merged[df_merged['_merge'] == 'both']
 
     # Drop merge indicator and redundant columns
     cols_to_drop = ['_merge', 'country_code_2', 'country_openaq', 'country_wb']
     cols_to_drop = [c for c in cols_to_drop if c in df_analysis.columns]
-    df_analysis.drop(columns=cols_to_drop, inplace=True)
+    df_analysis = df_analysis.drop(columns=cols_to_drop)
 
     logger.log(f" Analysis dataset: {len(df_analysis):,} records")
     logger.log(f"  Countries: {df_analysis['country'].nunique()}")
@@ -383,6 +517,21 @@ def merge_datasets(
 # COMPLETE CLEANING PIPELINE
 # ============================================================================
 
+def _clean_world_bank_data_deferred(df_wb_raw: pd.DataFrame) -> Tuple[pd.DataFrame, Dict, Logger]:
+    """
+    Clean World Bank data with a deferred logger, for use in a worker process.
+
+    Args:
+        df_wb_raw: Raw World Bank DataFrame
+
+    Returns:
+        Tuple of (cleaned_df, cleaning_stats, worker_logger)
+    """
+    worker_logger = Logger(defer_console=True)
+    df_wb_clean, wb_stats = clean_world_bank_data(df_wb_raw, worker_logger)
+    return df_wb_clean, wb_stats, worker_logger
+
+
 def clean_and_merge_data(
     df_openaq_raw: pd.DataFrame,
     df_wb_raw: pd.DataFrame,
@@ -406,11 +555,12 @@ def clean_and_merge_data(
             wb_stats
         )
     """
-    # Clean OpenAQ data
-    df_openaq_clean, openaq_stats = clean_openaq_data(df_openaq_raw, logger)
-
-    # Clean World Bank data
-    df_wb_clean, wb_stats = clean_world_bank_data(df_wb_raw, logger)
+    # Clean World Bank data in a worker process while OpenAQ data is cleaned here
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        wb_future = executor.submit(_clean_world_bank_data_deferred, df_wb_raw)
+        df_openaq_clean, openaq_stats = clean_openaq_data(df_openaq_raw, logger)
+        df_wb_clean, wb_stats, wb_logger = wb_future.result()
+    logger.merge(wb_logger)
 
     # Aggregate OpenAQ by country
     df_openaq_agg = aggregate_openaq_by_country(df_openaq_clean, logger)
@@ -0,0 +1,184 @@
+"""
+Data Cleaning Module (Dask engine)
+==================================
+Out-of-core OpenAQ cleaning for raw files that do not fit in memory.
+
+The raw file is read in partitions, and the unknown-country, coordinate and
+value filters (steps 1-3 of data_cleaning.clean_openaq_data) run on each
+partition in parallel, so only surviving rows are ever materialized. The
+remaining steps, the aggregation and the merge then reuse the pandas
+implementation on the much smaller filtered frame.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Tuple
+
+import dask
+import dask.dataframe as dd
+import pandas as pd
+
+from src.config import (
+    PARAMETER_THRESHOLDS, OPENAQ_RAW_COLUMNS, OPENAQ_RAW_DTYPES, DASK_BLOCKSIZE
+)
+from src.data_cleaning import (
+    get_openaq_removal_flags, clean_openaq_data as clean_openaq_data_pandas,
+    clean_world_bank_data, aggregate_openaq_by_country, merge_datasets
+)
+from src.utils import Logger, is_parquet_cache_fresh
+
+try:
+    from dask.distributed import Client, LocalCluster
+except ImportError:
+    Client = None
+
+
+# ============================================================================
+# OPENAQ DATA LOADING
+# ============================================================================
+
+def read_openaq_raw(csv_path: Path, parquet_path: Path) -> dd.DataFrame:
+    """
+    Lazily read raw OpenAQ data in partitions, preferring an up-to-date Parquet copy.
+
+    Args:
+        csv_path: Path to raw CSV file (may not exist)
+        parquet_path: Path to Parquet file
+
+    Returns:
+        Dask DataFrame over the raw OpenAQ data
+    """
+    if is_parquet_cache_fresh(csv_path, parquet_path):
+        return dd.read_parquet(parquet_path, columns=OPENAQ_RAW_COLUMNS).astype(OPENAQ_RAW_DTYPES)
+
+    return dd.read_csv(
+        csv_path,
+        blocksize=DASK_BLOCKSIZE,
+        usecols=OPENAQ_RAW_COLUMNS,
+        dtype=OPENAQ_RAW_DTYPES,
+        parse_dates=['datetime']
+    )
+
+
+@contextmanager
+def local_client():
+    """
+    Run Dask work on a local cluster using half of the available cores.
+
+    Falls back to Dask's default threaded scheduler when dask.distributed
+    is not installed.
+    """
+    if Client is None:
+        yield
+        return
+
+    n_workers = max(1, (os.cpu_count() or 2) // 2)
+    with LocalCluster(n_workers=n_workers) as cluster, Client(cluster):
+        yield
+
+
+# ============================================================================
+# OPENAQ DATA CLEANING
+# ============================================================================
+
+def clean_openaq_data(ddf: dd.DataFrame, logger: Logger) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Comprehensive cleaning of OpenAQ data.
+
+    Args:
+        ddf: Dask DataFrame over raw OpenAQ data
+        logger: Logger instance
+
+    Returns:
+        Tuple of (cleaned_df, cleaning_stats)
+    """
+    logger.log("=" * 80)
+    logger.log("CLEANING OPENAQ DATA (DASK)")
+    logger.log("=" * 80)
+
+    masks = ddf.map_partitions(
+        get_openaq_removal_flags,
+        meta={'unknown_country': bool, 'invalid_coordinates': bool, 'invalid_value': bool}
+    )
+    invalid_per_param = ddf['parameter'][masks['invalid_value']].value_counts()
+    filtered = ddf[~masks.any(axis=1)]
+
+    # One pass over the raw partitions computes the counts and the survivors
+    initial_count, removed, invalid_per_param, df = dask.compute(
+        masks.shape[0], masks.sum(), invalid_per_param, filtered
+    )
+    logger.log(f"Filtered {initial_count:,} records in {ddf.npartitions:,} partitions")
+
+    for param, invalid_count in invalid_per_param.sort_index().items():
+        if invalid_count > 0:
+            limits = PARAMETER_THRESHOLDS[param]
+            logger.log(f"  Removing {invalid_count:,} invalid {param} values (outside {limits['min']}-{limits['max']} {limits['unit']})")
+
+    # Duplicates, datetime components and quality flags on the in-memory survivors
+    df, pandas_stats = clean_openaq_data_pandas(df.reset_index(drop=True), Logger(print_to_console=False))
+
+    cleaning_stats = {
+        'initial': int(initial_count),
+        'removed_unknown_countries': int(removed['unknown_country']),
+        'removed_invalid_coordinates': int(removed['invalid_coordinates']),
+        'removed_invalid_values': int(removed['invalid_value']),
+        'removed_duplicates': pandas_stats['removed_duplicates'],
+        'final': pandas_stats['final']
+    }
+
+    # Summary
+    logger.log("CLEANING SUMMARY:")
+    logger.log(f"  Initial records: {cleaning_stats['initial']:,}")
+    logger.log(f"  - Unknown countries: -{cleaning_stats['removed_unknown_countries']:,}")
+    logger.log(f"  - Invalid coordinates: -{cleaning_stats['removed_invalid_coordinates']:,}")
+    logger.log(f"  - Invalid values: -{cleaning_stats['removed_invalid_values']:,}")
+    logger.log(f"  - Duplicates: -{cleaning_stats['removed_duplicates']:,}")
+    logger.log(f"  = Final records: {cleaning_stats['final']:,}")
+    logger.log(f"  Data retention: {cleaning_stats['final']/cleaning_stats['initial']*100:.2f}%")
+    logger.log("")
+
+    return df, cleaning_stats
+
+
+# ============================================================================
+# COMPLETE CLEANING PIPELINE
+# ============================================================================
+
+def clean_and_merge_data(
+    openaq_raw: dd.DataFrame,
+    df_wb_raw: pd.DataFrame,
+    logger: Logger
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict, Dict]:
+    """
+    Complete data cleaning and merging pipeline using Dask for OpenAQ data.
+
+    Args:
+        openaq_raw: Dask DataFrame over raw OpenAQ data (see read_openaq_raw)
+        df_wb_raw: Raw World Bank DataFrame
+        logger: Logger instance
+
+    Returns:
+        Same tuple as data_cleaning.clean_and_merge_data
+    """
+    # Clean OpenAQ data
+    with local_client():
+        df_openaq_clean, openaq_stats = clean_openaq_data(openaq_raw, logger)
+
+    # Clean World Bank data
+    df_wb_clean, wb_stats = clean_world_bank_data(df_wb_raw, logger)
+
+    # Aggregate OpenAQ by country
+    df_openaq_agg = aggregate_openaq_by_country(df_openaq_clean, logger)
+
+    # Merge datasets
+    df_analysis, df_merged_full = merge_datasets(df_openaq_agg, df_wb_clean, logger)
+
+    return (
+        df_openaq_clean,
+        df_wb_clean,
+        df_analysis,
+        df_merged_full,
+        openaq_stats,
+        wb_stats
+    )
@@ -0,0 +1,230 @@
+"""
+Data Cleaning Module (Polars engine)
+====================================
+Polars implementation of the OpenAQ cleaning and aggregation steps.
+
+Mirrors the OpenAQ functions in data_cleaning.py, but runs them as a single
+lazy query plan that Polars optimizes and executes with its streaming engine.
+The World Bank cleaning and the final merge reuse the pandas implementation,
+since those tables are small. Results are converted to pandas at the end.
+"""
+
+import pandas as pd
+import polars as pl
+from pathlib import Path
+from typing import Dict, Tuple
+
+from src.config import (
+    PARAMETER_THRESHOLDS, LAT_MIN, LAT_MAX, LON_MIN, LON_MAX
+)
+from src.data_cleaning import clean_world_bank_data, merge_datasets
+from src.utils import Logger, is_parquet_cache_fresh
+
+
+# ============================================================================
+# OPENAQ DATA LOADING
+# ============================================================================
+
+def scan_openaq_raw(csv_path: Path, parquet_path: Path) -> pl.LazyFrame:
+    """
+    Lazily scan raw OpenAQ data, preferring an up-to-date Parquet copy.
+
+    Args:
+        csv_path: Path to raw CSV file (may not exist)
+        parquet_path: Path to Parquet file
+
+    Returns:
+        LazyFrame over the raw OpenAQ data
+    """
+    if is_parquet_cache_fresh(csv_path, parquet_path):
+        lf = pl.scan_parquet(parquet_path)
+        # Parquet files written by older versions of fetch_data.py kept the API's
+        # ISO timestamps as strings
+        if lf.collect_schema()['datetime'] == pl.String:
+            lf = lf.with_columns(pl.col('datetime').str.to_datetime(time_zone='UTC', strict=False))
+        return lf
+    return pl.scan_csv(csv_path, try_parse_dates=True)
+
+
+# ============================================================================
+# OPENAQ DATA CLEANING
+# ============================================================================
+
+def _value_in_range() -> pl.Expr:
+    """Build an expression that checks each value against its parameter's thresholds."""
+    expr = None
+    for param, thresholds in PARAMETER_THRESHOLDS.items():
+        condition = pl.col('parameter') == param
+        check = pl.col('value').is_between(thresholds['min'], thresholds['max'])
+        expr = pl.when(condition).then(check) if expr is None else expr.when(condition).then(check)
+    # Missing values and parameters without thresholds are kept
+    return expr.otherwise(pl.lit(True)).fill_null(True)
+
+
+def clean_openaq_data(lf: pl.LazyFrame, logger: Logger) -> Tuple[pl.DataFrame, Dict]:
+    """
+    Comprehensive cleaning of OpenAQ data.
+
+    Args:
+        lf: LazyFrame over raw OpenAQ data
+        logger: Logger instance
+
+    Returns:
+        Tuple of (cleaned_df, cleaning_stats)
+    """
+    logger.log("=" * 80)
+    logger.log("CLEANING OPENAQ DATA (POLARS)")
+    logger.log("=" * 80)
+
+    unknown = pl.col('country') == 'Unknown'
+    coords_ok = (
+        (pl.col('latitude').is_null() | pl.col('latitude').is_between(LAT_MIN, LAT_MAX)) &
+        (pl.col('longitude').is_null() | pl.col('longitude').is_between(LON_MIN, LON_MAX))
+    )
+    value_ok = _value_in_range()
+
+    # Row counts for each cleaning step, in the same order as the pandas engine
+    stats_lf = lf.select(
+        pl.len().alias('initial'),
+        unknown.sum().alias('removed_unknown_countries'),
+        (~unknown & ~coords_ok).sum().alias('removed_invalid_coordinates'),
+        (~unknown & coords_ok & ~value_ok).sum().alias('removed_invalid_values')
+    )
+    invalid_lf = (
+        lf.filter(~unknown & coords_ok & ~value_ok)
+        .group_by('parameter')
+        .agg(pl.len().alias('invalid_count'))
+        .sort('parameter')
+    )
+    cleaned_lf = (
+        lf.filter(~unknown & coords_ok & value_ok)
+        .with_columns(pl.col('datetime').cast(pl.Datetime('us', 'UTC'), strict=False))
+        .unique(subset=['parameter', 'location_id', 'datetime', 'value'], keep='first', maintain_order=True)
+        .with_columns(
+            pl.col('datetime').dt.year().alias('measurement_year'),
+            pl.col('datetime').dt.month().alias('measurement_month'),
+            pl.col('datetime').dt.hour().alias('measurement_hour'),
+            (pl.col('latitude').is_not_null() & pl.col('longitude').is_not_null()).alias('has_coordinates'),
+            ((pl.col('city') != 'Unknown') & pl.col('city').is_not_null()).fill_null(False).alias('has_city')
+        )
+    )
+
+    # One optimized plan for all three outputs
+    df, stats_df, invalid_df = pl.collect_all([cleaned_lf, stats_lf, invalid_lf], engine='streaming')
+
+    cleaning_stats = stats_df.row(0, named=True)
+    kept = (
+        cleaning_stats['initial'] - cleaning_stats['removed_unknown_countries'] -
+        cleaning_stats['removed_invalid_coordinates'] - cleaning_stats['removed_invalid_values']
+    )
+    cleaning_stats['removed_duplicates'] = kept - df.height
+    cleaning_stats['final'] = df.height
+
+    for param, invalid_count in invalid_df.iter_rows():
+        limits = PARAMETER_THRESHOLDS[param]
+        logger.log(f"  Removing {invalid_count:,} invalid {param} values (outside {limits['min']}-{limits['max']} {limits['unit']})")
+
+    # Summary
+    logger.log("CLEANING SUMMARY:")
+    logger.log(f"  Initial records: {cleaning_stats['initial']:,}")
+    logger.log(f"  - Unknown countries: -{cleaning_stats['removed_unknown_countries']:,}")
+    logger.log(f"  - Invalid coordinates: -{cleaning_stats['removed_invalid_coordinates']:,}")
+    logger.log(f"  - Invalid values: -{cleaning_stats['removed_invalid_values']:,}")
+    logger.log(f"  - Duplicates: -{cleaning_stats['removed_duplicates']:,}")
+    logger.log(f"  = Final records: {cleaning_stats['final']:,}")
+    logger.log(f"  Data retention: {cleaning_stats['final']/cleaning_stats['initial']*100:.2f}%")
+    logger.log("")
+
+    return df, cleaning_stats
+
+
+# ============================================================================
+# OPENAQ AGGREGATION BY COUNTRY
+# ============================================================================
+
+def aggregate_openaq_by_country(df: pl.DataFrame, logger: Logger) -> pd.DataFrame:
+    """
+    Aggregate OpenAQ data by country for merging with World Bank data.
+
+    Args:
+        df: Cleaned OpenAQ DataFrame
+        logger: Logger instance
+
+    Returns:
+        Aggregated pandas DataFrame (one row per country)
+    """
+    logger.log("=" * 80)
+    logger.log("AGGREGATING OPENAQ DATA BY COUNTRY (POLARS)")
+    logger.log("=" * 80)
+
+    value_cols = ['mean_value', 'measurement_count', 'median_value', 'num_locations']
+
+    df_agg = df.group_by(['country', 'country_code', 'parameter']).agg(
+        pl.col('value').mean().alias('mean_value'),
+        pl.col('value').median().alias('median_value'),
+        pl.col('value').count().cast(pl.Float64).alias('measurement_count'),
+        pl.col('location_id').n_unique().cast(pl.Float64).alias('num_locations')
+    )
+
+    # Pivot to get one row per country with columns for each parameter
+    df_pivot = (
+        df_agg.pivot(on='parameter', index=['country', 'country_code'], values=value_cols, separator='_')
+        .with_columns(pl.col('country', 'country_code').cast(pl.String))
+        .sort(['country', 'country_code'])
+        .to_pandas()
+    )
+
+    # Same column order as the pandas engine: metric, then parameter
+    parameters = sorted(df_agg['parameter'].unique().to_list())
+    df_pivot = df_pivot[
+        ['country', 'country_code'] +
+        [f'{col}_{param}' for col in value_cols for param in parameters]
+    ]
+
+    logger.log(f"  Aggregated to {len(df_pivot):,} countries")
+    logger.log(f"  Columns created: {len(df_pivot.columns)}")
+    logger.log("")
+
+    return df_pivot
+
+
+# ============================================================================
+# COMPLETE CLEANING PIPELINE
+# ============================================================================
+
+def clean_and_merge_data(
+    openaq_raw: pl.LazyFrame,
+    df_wb_raw: pd.DataFrame,
+    logger: Logger
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict, Dict]:
+    """
+    Complete data cleaning and merging pipeline using Polars for OpenAQ data.
+
+    Args:
+        openaq_raw: LazyFrame over raw OpenAQ data (see scan_openaq_raw)
+        df_wb_raw: Raw World Bank DataFrame
+        logger: Logger instance
+
+    Returns:
+        Same tuple as data_cleaning.clean_and_merge_data
+    """
+    # Clean OpenAQ data
+    df_openaq_clean, openaq_stats = clean_openaq_data(openaq_raw, logger)
+
+    # Clean World Bank data
+    df_wb_clean, wb_stats = clean_world_bank_data(df_wb_raw, logger)
+
+    # Aggregate OpenAQ by country
+    df_openaq_agg = aggregate_openaq_by_country(df_openaq_clean, logger)
+
+    # Merge datasets
+    df_analysis, df_merged_full = merge_datasets(df_openaq_agg, df_wb_clean, logger)
+
+    return (
+        df_openaq_clean.to_pandas(),
+        df_wb_clean,
+        df_analysis,
+        df_merged_full,
+        openaq_stats,
+        wb_stats
+    )
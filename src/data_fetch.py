@@ -4,26 +4,278 @@ Data Fetching Module
 Fetches data from OpenAQ v3 and World Bank APIs with caching support.
 """
 
+import json
+import math
+import numpy as np
 import pandas as pd
 import requests
+import threading
 import time
 import wbgapi as wb
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Tuple, Optional
+from urllib3.util.retry import Retry
 
 from src.config import (
     OPENAQ_API_KEY, OPENAQ_BASE_URL, OPENAQ_PARAMETERS,
     WORLD_BANK_INDICATORS, WB_START_YEAR, WB_END_YEAR,
     MAX_PAGES_LOCATIONS, MAX_PAGES_MEASUREMENTS,
     ITEMS_PER_PAGE, REQUEST_TIMEOUT, REQUEST_DELAY,
-    DATA_DIR, OPENAQ_RAW_CSV, WORLDBANK_RAW_CSV
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    REQUEST_RETRIES, REQUEST_BACKOFF_FACTOR, RETRY_STATUS_CODES, OPENAQ_FETCH_WORKERS, OPENAQ_HTTP2,
+    DATA_DIR, OPENAQ_RAW_CSV, WORLDBANK_RAW_CSV, OPENAQ_RAW_PARQUET, WORLDBANK_RAW_PARQUET,
+    OPENAQ_RAW_JSON, WORLDBANK_RAW_JSON, DEBUG_JSON_DUMP, OPENAQ_RAW_DTYPES,
+    OPENAQ_LOCATIONS_PARQUET, OPENAQ_LOCATIONS_MAX_AGE_DAYS
 )
-from src.utils import Logger, load_csv_if_exists
+from src.utils import Logger, load_csv_with_parquet_cache, check_file_exists, save_parquet
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+except ImportError:
+    httpx = None
+
+
+# ============================================================================
+# HTTP SESSION
+# ============================================================================
+
+def create_openaq_session():
+    """
+    Create an HTTP client for the OpenAQ API.
+
+    With httpx[http2] installed (and OPENAQ_HTTP2 set), an httpx Client
+    multiplexes concurrent requests over HTTP/2 connections. Otherwise a
+    requests Session keeps HTTP/1.1 connections alive and retries
+    rate-limited (429) and transient server errors with backoff.
+
+    Returns:
+        Configured httpx Client or requests Session
+    """
+    headers = {'Accept': 'application/json'}
+    if OPENAQ_API_KEY:
+        headers['X-API-Key'] = OPENAQ_API_KEY
+
+    if httpx is not None and OPENAQ_HTTP2:
+        limits = httpx.Limits(max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=HTTP_POOL_MAXSIZE)
+        # Transport retries cover connection failures; get_openaq_page retries error statuses
+        transport = httpx.HTTPTransport(http2=True, limits=limits, retries=REQUEST_RETRIES)
+        return httpx.Client(http2=True, headers=headers, limits=limits, transport=transport)
+
+    session = requests.Session()
+    session.headers.update(headers)
+
+    retries = Retry(
+        total=REQUEST_RETRIES,
+        backoff_factor=REQUEST_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=['GET']
+    )
+    session.mount('https://', HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retries
+    ))
+
+    return session
+
+
+class RateLimiter:
+    """
+    Space out requests made from any thread and honour API rate-limit headers.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between the start of two requests
+        """
+        self.min_interval = min_interval
+        self.next_request = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_request - now
+            self.next_request = max(now, self.next_request) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response):
+        """
+        Pause all requests until the limit resets when a response reports none left.
+
+        Args:
+            response: requests or httpx response carrying X-RateLimit-* headers
+        """
+        if response.headers.get('X-RateLimit-Remaining') != '0':
+            return
+        reset = float(response.headers.get('X-RateLimit-Reset', self.min_interval))
+        with self.lock:
+            self.next_request = max(self.next_request, time.monotonic() + reset)
+
+
+# Shared by all OpenAQ requests in this process
+_SESSION = create_openaq_session()
+_RATE_LIMITER = RateLimiter(REQUEST_DELAY)
+
+# Errors raised by a failed OpenAQ request, for either HTTP client
+REQUEST_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+def get_openaq_page(url: str, params: Dict):
+    """
+    Request one page from the OpenAQ API through the shared session and rate limiter.
+
+    Args:
+        url: Endpoint URL
+        params: Query parameters
+
+    Returns:
+        Successful response
+
+    Raises:
+        One of REQUEST_ERRORS: If the request fails
+    """
+    for attempt in range(REQUEST_RETRIES + 1):
+        _RATE_LIMITER.wait()
+        response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        _RATE_LIMITER.update(response)
+        # A requests Session already retried these in its adapter
+        if response.status_code not in RETRY_STATUS_CODES or attempt == REQUEST_RETRIES:
+            break
+        time.sleep(REQUEST_BACKOFF_FACTOR * 2 ** attempt)
+
+    response.raise_for_status()
+    return response
+
+
+def decode_json(response) -> Dict:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: requests or httpx response with a JSON body
+
+    Returns:
+        Decoded JSON object
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+    """
+    loads = json.loads if orjson is None else orjson.loads
+    try:
+        return loads(response.content)
+    except json.JSONDecodeError as e:
+        # orjson's error subclasses json's; re-raised so both HTTP clients fail alike
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def iter_openaq_pages(url: str, params: Dict, max_pages: int) -> Iterator[Tuple[int, Dict]]:
+    """
+    Iterate over the pages of a paginated OpenAQ endpoint.
+
+    The next page is requested in the background while the caller processes
+    the current one. Pagination stops at the last page implied by the
+    reported total (meta.found, when it is an exact count) or at a page with
+    fewer results than the limit. Close the iterator when stopping early so
+    the prefetched request is cancelled.
+
+    Args:
+        url: Endpoint URL
+        params: Query parameters (without 'page')
+        max_pages: Maximum number of pages to request
+
+    Yields:
+        Tuples of (page_number, decoded JSON response)
+
+    Raises:
+        One of REQUEST_ERRORS: If a page request fails
+    """
+    def request_page(page: int) -> Dict:
+        return decode_json(get_openaq_page(url, {**params, 'page': page}))
+
+    limit = params.get('limit', 0)
+    last_page = max_pages
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = executor.submit(request_page, 1)
+
+    try:
+        for page in range(1, max_pages + 1):
+            data = pending.result()
+            pending = None
+
+            # 'found' may be a lower bound such as '>1000'; only exact counts bound the crawl
+            found = data.get('meta', {}).get('found')
+            if isinstance(found, int) and limit > 0:
+                last_page = min(last_page, math.ceil(found / limit))
+
+            if page < last_page and len(data.get('results', [])) >= limit:
+                pending = executor.submit(request_page, page + 1)
+            yield page, data
+            if pending is None:
+                break
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
 
 
 # ============================================================================
 # OPENAQ API FUNCTIONS
 # ============================================================================
 
+# Location metadata columns, as stored in the location lookup
+LOCATION_FIELDS = ['location_name', 'country_code', 'country', 'city']
+
+# Parsed measurement columns stored with the compact raw dtypes
+OPENAQ_NUMERIC_COLUMNS = ['value', 'location_id', 'latitude', 'longitude', 'sensors_id']
+
+
+def load_cached_locations(cache_path: Path) -> Dict[int, Dict[str, str]]:
+    """
+    Load a location lookup saved by save_cached_locations.
+
+    Args:
+        cache_path: Path to the Parquet cache file
+
+    Returns:
+        Location lookup, or an empty dict if the cache is missing or too old
+    """
+    if not check_file_exists(cache_path):
+        return {}
+
+    age_days = (time.time() - cache_path.stat().st_mtime) / 86400
+    if age_days > OPENAQ_LOCATIONS_MAX_AGE_DAYS:
+        return {}
+
+    return pd.read_parquet(cache_path).set_index('location_id').to_dict(orient='index')
+
+
+def save_cached_locations(location_lookup: Dict[int, Dict[str, str]], cache_path: Path):
+    """
+    Save a location lookup as a Parquet file with one row per location.
+
+    Args:
+        location_lookup: Location metadata lookup
+        cache_path: Path to the Parquet cache file
+    """
+    df = pd.DataFrame.from_dict(location_lookup, orient='index', columns=LOCATION_FIELDS)
+    save_parquet(df.rename_axis('location_id').reset_index(), cache_path)
+
+
 def fetch_openaq_locations(
     parameter_id: int,
     parameter_name: str,
@@ -33,40 +285,50 @@ def fetch_openaq_locations(
     """
     Fetch locations with country metadata for a specific parameter from OpenAQ v3.
 
+    Location metadata rarely changes, so a complete lookup is cached on disk
+    and reused until it is older than OPENAQ_LOCATIONS_MAX_AGE_DAYS. A lookup
+    is complete when pagination ends on a short page or at the reported total;
+    one cut off by MAX_PAGES_LOCATIONS is returned but not cached.
+
     Args:
         parameter_id: OpenAQ parameter ID
         parameter_name: Human-readable parameter name
         logger: Logger instance
-        limit: Max items per page
+        limit: Max items per page (only the page size, so it is not part of
+            the cache key: a complete lookup is the same for any limit)
 
     Returns:
         Dictionary mapping location_id to location metadata
     """
     logger.log(f"Fetching {parameter_name} locations from OpenAQ v3...")
 
+    cache_path = DATA_DIR / OPENAQ_LOCATIONS_PARQUET.format(parameter_id=parameter_id)
+    location_lookup = load_cached_locations(cache_path)
+    if location_lookup:
+        logger.log(f"  ✓ Loaded lookup table with {len(location_lookup)} locations from cache")
+        return location_lookup
+
     url = f"{OPENAQ_BASE_URL}/locations"
-    headers = {
-        'X-API-Key': OPENAQ_API_KEY,
-        'Accept': 'application/json'
-    }
 
     location_lookup = {}
-    page = 1
-
-    while page <= MAX_PAGES_LOCATIONS:
-        params = {
-            'limit': min(limit, ITEMS_PER_PAGE),
-            'page': page,
-            'parameters_id': parameter_id
-        }
-
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
+    params = {
+        'limit': min(limit, ITEMS_PER_PAGE),
+        'parameters_id': parameter_id
+    }
+    pages = iter_openaq_pages(url, params, MAX_PAGES_LOCATIONS)
+    complete = False
 
-            data = response.json()
+    try:
+        for page, data in pages:
             results = data.get('results', [])
 
+            # Pagination ran out naturally: an empty or short page, or the
+            # last page of an exact reported total
+            found = data.get('meta', {}).get('found')
+            complete = len(results) < params['limit'] or (
+                isinstance(found, int) and page * params['limit'] >= found
+            )
+
             if not results:
                 break
 
@@ -84,18 +346,17 @@ def fetch_openaq_locations(
                         'city': loc.get('locality', 'Unknown'),
                     }
 
-            # Check if we've retrieved all results
-            meta = data.get('meta', {})
-            found = meta.get('found', 0)
-            if isinstance(found, int) and found <= len(location_lookup):
-                break
-
-            page += 1
-            time.sleep(REQUEST_DELAY)
-
-        except requests.exceptions.RequestException as e:
-            logger.log(f"  ✗ Error fetching locations: {e}")
-            break
+    except REQUEST_ERRORS as e:
+        logger.log(f"  ✗ Error fetching locations: {e}")
+    else:
+        # Only complete lookups are cached; a partial one would drop the
+        # measurements of unlisted locations until the cache expires
+        if complete and location_lookup:
+            save_cached_locations(location_lookup, cache_path)
+        elif not complete:
+            logger.log(f"  ⚠ Stopped after {MAX_PAGES_LOCATIONS} pages; lookup not cached")
+    finally:
+        pages.close()
 
     logger.log(f"  ✓ Built lookup table with {len(location_lookup)} locations")
     return location_lookup
@@ -122,25 +383,15 @@ def fetch_openaq_latest_measurements(
     logger.log(f"Fetching latest {parameter_name} measurements from OpenAQ v3...")
 
     url = f"{OPENAQ_BASE_URL}/parameters/{parameter_id}/latest"
-    headers = {
-        'X-API-Key': OPENAQ_API_KEY,
-        'Accept': 'application/json'
-    }
 
     all_measurements = []
-    page = 1
-
-    while page <= MAX_PAGES_MEASUREMENTS:
-        params = {
-            'limit': min(limit, ITEMS_PER_PAGE),
-            'page': page
-        }
-
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
+    params = {
+        'limit': min(limit, ITEMS_PER_PAGE)
+    }
+    pages = iter_openaq_pages(url, params, MAX_PAGES_MEASUREMENTS)
 
-            data = response.json()
+    try:
+        for page, data in pages:
             results = data.get('results', [])
 
             if not results:
@@ -149,18 +400,10 @@ def fetch_openaq_latest_measurements(
             logger.log(f"  Page {page}: {len(results)} measurements", print_override=False)
             all_measurements.extend(results)
 
-            # Check if we've retrieved all results
-            meta = data.get('meta', {})
-            found = meta.get('found', 0)
-            if isinstance(found, int) and found <= len(all_measurements):
-                break
-
-            page += 1
-            time.sleep(REQUEST_DELAY)
-
-        except requests.exceptions.RequestException as e:
-            logger.log(f"  ✗ Error fetching {parameter_name}: {e}")
-            break
+    except REQUEST_ERRORS as e:
+        logger.log(f"  ✗ Error fetching {parameter_name}: {e}")
+    finally:
+        pages.close()
 
     logger.log(f"  ✓ Fetched {len(all_measurements)} {parameter_name} measurements")
     return all_measurements
@@ -170,9 +413,9 @@ def parse_openaq_measurements(
     measurements: List[Dict],
     parameter_name: str,
     location_lookup: Dict[int, Dict[str, str]]
-) -> pd.DataFrame:
+) -> Dict[str, np.ndarray]:
     """
-    Parse OpenAQ measurements into a structured DataFrame.
+    Parse OpenAQ measurements into one array per output column.
 
     Args:
         measurements: List of measurement dictionaries
@@ -180,44 +423,94 @@ def parse_openaq_measurements(
         location_lookup: Location metadata lookup
 
     Returns:
-        DataFrame with parsed measurements
+        Dictionary mapping column name to values (empty if nothing was parsed)
     """
-    records = []
+    values, location_ids, latitudes, longitudes, datetimes, sensor_ids = [], [], [], [], [], []
 
+    # One pass over the raw measurements, filling one list per column
     for m in measurements:
-        try:
-            location_id = m.get('locationsId')
-            location_info = location_lookup.get(location_id, {})
-
-            coordinates = m.get('coordinates', {})
-            value = m.get('value')
-            datetime_str = m.get('datetime', {}).get('utc') if m.get('datetime') else None
-
-            if value is not None:
-                record = {
-                    'parameter': parameter_name,
-                    'value': float(value),
-                    'location_id': location_id,
-                    'location_name': location_info.get('location_name', 'Unknown'),
-                    'country_code': location_info.get('country_code', 'Unknown'),
-                    'country': location_info.get('country', 'Unknown'),
-                    'city': location_info.get('city', 'Unknown'),
-                    'latitude': coordinates.get('latitude'),
-                    'longitude': coordinates.get('longitude'),
-                    'datetime': datetime_str,
-                    'sensors_id': m.get('sensorsId')
-                }
-                records.append(record)
-        except Exception:
+        value = m.get('value')
+        if value is None:
             continue
 
-    return pd.DataFrame(records)
+        # Null coordinates or datetime objects are kept as missing values
+        coordinates = m.get('coordinates') or {}
+        values.append(value)
+        location_ids.append(m.get('locationsId'))
+        latitudes.append(coordinates.get('latitude'))
+        longitudes.append(coordinates.get('longitude'))
+        datetimes.append((m.get('datetime') or {}).get('utc'))
+        sensor_ids.append(m.get('sensorsId'))
+
+    if not values:
+        return {}
+
+    # Join location metadata for all rows at once; the appended 'Unknown'
+    # is picked for locations missing from the lookup (indexer -1)
+    lookup = pd.DataFrame.from_dict(location_lookup, orient='index', columns=LOCATION_FIELDS)
+    rows = lookup.index.get_indexer(location_ids)
+
+    columns = {
+        'parameter': np.full(len(values), parameter_name, dtype=object),
+        'value': np.array(values, dtype=np.float32),
+        'location_id': np.array(location_ids)
+    }
+    for field in LOCATION_FIELDS:
+        columns[field] = np.append(lookup[field].to_numpy(dtype=object), 'Unknown')[rows]
+    columns.update({
+        'latitude': np.array(latitudes, dtype=np.float32),
+        'longitude': np.array(longitudes, dtype=np.float32),
+        'datetime': np.array(datetimes, dtype=object),
+        'sensors_id': np.array(sensor_ids)
+    })
+
+    return columns
+
+
+def fetch_openaq_parameter(param_key: str, param_id: int, logger: Logger) -> Dict[str, np.ndarray]:
+    """
+    Fetch locations and latest measurements for one parameter and parse them.
+
+    Args:
+        param_key: Parameter key from OPENAQ_PARAMETERS
+        param_id: OpenAQ parameter ID
+        logger: Logger instance
+
+    Returns:
+        Parsed measurement columns (empty if nothing was collected)
+    """
+    # Fetch location metadata
+    location_lookup = fetch_openaq_locations(param_id, param_key.upper(), logger)
+
+    # Skip if location lookup failed
+    if not location_lookup:
+        logger.log(f"  ⚠ Skipping {param_key.upper()} - no location data available")
+        return {}
+
+    # Fetch measurements
+    measurements = fetch_openaq_latest_measurements(param_id, param_key.upper(), logger)
+
+    if not measurements:
+        return {}
+
+    columns = parse_openaq_measurements(measurements, param_key.upper(), location_lookup)
+    if columns:
+        n_records = len(columns['value'])
+        valid_countries = (columns['country'] != 'Unknown').sum()
+        logger.log(f"  ✓ Parsed {n_records} valid {param_key.upper()} records")
+        logger.log(f"    → {valid_countries}/{n_records} records with valid country data")
+
+    return columns
 
 
 def fetch_all_openaq_data(logger: Logger) -> pd.DataFrame:
     """
     Fetch all OpenAQ data for all configured parameters.
 
+    Parameters are fetched concurrently on a thread pool; each one logs into
+    a deferred logger that is merged in parameter order. The parsed columns
+    of all parameters are concatenated and turned into one DataFrame.
+
     Args:
         logger: Logger instance
 
@@ -230,31 +523,27 @@ def fetch_all_openaq_data(logger: Logger) -> pd.DataFrame:
 
     all_openaq_data = []
 
-    for param_key, param_id in OPENAQ_PARAMETERS.items():
-        # Fetch location metadata
-        location_lookup = fetch_openaq_locations(param_id, param_key.upper(), logger)
-
-        # Skip if location lookup failed
-        if not location_lookup:
-            logger.log(f"  ⚠ Skipping {param_key.upper()} - no location data available")
-            time.sleep(1)
-            continue
-
-        # Fetch measurements
-        measurements = fetch_openaq_latest_measurements(param_id, param_key.upper(), logger)
-
-        if measurements and location_lookup:
-            df = parse_openaq_measurements(measurements, param_key.upper(), location_lookup)
-            if not df.empty:
-                all_openaq_data.append(df)
-                valid_countries = (df['country'] != 'Unknown').sum()
-                logger.log(f"  ✓ Parsed {len(df)} valid {param_key.upper()} records")
-                logger.log(f"    → {valid_countries}/{len(df)} records with valid country data")
+    with ThreadPoolExecutor(max_workers=OPENAQ_FETCH_WORKERS) as executor:
+        fetches = []
+        for param_key, param_id in OPENAQ_PARAMETERS.items():
+            param_logger = Logger(logger.print_to_console, defer_console=True)
+            future = executor.submit(fetch_openaq_parameter, param_key, param_id, param_logger)
+            fetches.append((param_logger, future))
 
-        time.sleep(1)
+        for param_logger, future in fetches:
+            columns = future.result()
+            logger.merge(param_logger)
+            if columns:
+                all_openaq_data.append(columns)
 
     if all_openaq_data:
-        df_openaq = pd.concat(all_openaq_data, ignore_index=True)
+        df_openaq = pd.DataFrame({
+            col: np.concatenate([columns[col] for columns in all_openaq_data])
+            for col in all_openaq_data[0]
+        })
+        # Same numeric dtypes clean_data.py reads the raw data with; IDs may have gaps
+        df_openaq = df_openaq.astype({col: OPENAQ_RAW_DTYPES[col] for col in OPENAQ_NUMERIC_COLUMNS})
+        df_openaq['datetime'] = pd.to_datetime(df_openaq['datetime'], utc=True, format='ISO8601', errors='coerce')
         logger.log(f"\n✓ Total OpenAQ records: {len(df_openaq)}")
         logger.log(f"  Countries: {df_openaq['country'].nunique()}")
         logger.log(f"  Cities: {df_openaq['city'].nunique()}")
@@ -269,32 +558,41 @@ def fetch_all_openaq_data(logger: Logger) -> pd.DataFrame:
 # WORLD BANK API FUNCTIONS
 # ============================================================================
 
-def fetch_world_bank_indicator(
-    indicator_code: str,
-    indicator_name: str,
+@lru_cache(maxsize=1)
+def _wb_country_names() -> Dict[str, str]:
+    """
+    Map every World Bank economy code to its name, with a single API request.
+
+    Returns:
+        Dictionary mapping economy code to name
+    """
+    return {economy['id']: economy['value'] for economy in wb.economy.list()}
+
+
+def fetch_world_bank_indicators(
+    indicators: Dict[str, str],
     logger: Logger,
     start_year: int = WB_START_YEAR,
     end_year: int = WB_END_YEAR
 ) -> pd.DataFrame:
     """
-    Fetch World Bank indicator data using wbgapi.
+    Fetch several World Bank indicators with a single wbgapi request.
 
     Args:
-        indicator_code: World Bank indicator code
-        indicator_name: Human-readable indicator name
+        indicators: Mapping of column name to World Bank indicator code
         logger: Logger instance
         start_year: Start year for data
         end_year: End year for data
 
     Returns:
-        DataFrame with indicator data
+        DataFrame with one row per country and year, one column per indicator
     """
-    logger.log(f"Fetching {indicator_name}...")
+    logger.log(f"Fetching {', '.join(indicators)}...")
 
     try:
-        # Fetch data
+        # Fetch data, one column per indicator code
         df = wb.data.DataFrame(
-            indicator_code,
+            list(indicators.values()),
             economy='all',
             time=range(start_year, end_year + 1),
             skipBlanks=True,
@@ -302,27 +600,23 @@ def fetch_world_bank_indicator(
         )
 
         # Process DataFrame
-        df = df.reset_index()
-        df.columns = ['country_code', 'year'] + [indicator_name]
-        df['year'] = pd.to_numeric(df['year'].str.replace('YR', ''), errors='coerce')
-        df = df[df['year'].notna()]
-        df = df[df[indicator_name].notna()]
-        df['year'] = df['year'].astype(int)
-
-        # Get country names
-        country_names = {}
+        df = df.rename(columns={code: name for name, code in indicators.items()})
+        value_cols = [name for name in indicators if name in df.columns]
+        df = df.dropna(subset=value_cols, how='all').sort_index()
+        df = df.rename_axis(['country_code', 'year']).reset_index()
+        # wbgapi labels years as 'YR2015'
+        df['year'] = df['year'].str.slice(2).astype('int32')
+
+        # Get country names (codes are kept if the lookup fails)
         try:
-            for code in df['country_code'].unique()[:100]:
-                try:
-                    country_info = wb.economy.get(code)
-                    country_names[code] = country_info.get('value', code)
-                except:
-                    country_names[code] = code
-        except:
-            pass
+            country_names = _wb_country_names()
+        except Exception as e:
+            logger.log(f"  ⚠ Could not fetch country names: {e}")
+            country_names = {}
 
         df['country'] = df['country_code'].map(country_names).fillna(df['country_code'])
-        logger.log(f"  ✓ Fetched {len(df)} records ({df['country'].nunique()} countries)")
+        for name in value_cols:
+            logger.log(f"  ✓ {name}: {df[name].notna().sum()} records")
         return df
 
     except Exception as e:
@@ -344,20 +638,9 @@ def fetch_all_world_bank_data(logger: Logger) -> pd.DataFrame:
     logger.log("FETCHING WORLD BANK DATA")
     logger.log("=" * 80)
 
-    wb_data_frames = {}
-
-    for key, indicator_code in WORLD_BANK_INDICATORS.items():
-        df = fetch_world_bank_indicator(indicator_code, key, logger)
-        if not df.empty:
-            wb_data_frames[key] = df
-
-    if wb_data_frames:
-        logger.log("\nMerging World Bank datasets...")
-        df_wb = list(wb_data_frames.values())[0]
-
-        for df in list(wb_data_frames.values())[1:]:
-            df_wb = df_wb.merge(df, on=['country_code', 'country', 'year'], how='outer')
+    df_wb = fetch_world_bank_indicators(WORLD_BANK_INDICATORS, logger)
 
+    if not df_wb.empty:
         logger.log(f"✓ Combined World Bank data: {len(df_wb)} records")
         logger.log(f"  Countries: {df_wb['country'].nunique()}")
         logger.log(f"  Years: {df_wb['year'].min()}-{df_wb['year'].max()}")
@@ -373,7 +656,7 @@ def fetch_all_world_bank_data(logger: Logger) -> pd.DataFrame:
 
 def check_cached_data(logger: Logger) -> Tuple[bool, bool]:
     """
-    Check if data already exists locally.
+    Check if data already exists locally (as Parquet, or as a legacy CSV).
 
     Args:
         logger: Logger instance
@@ -385,11 +668,8 @@ def check_cached_data(logger: Logger) -> Tuple[bool, bool]:
     logger.log("CHECKING FOR LOCAL DATA")
     logger.log("=" * 80)
 
-    openaq_path = DATA_DIR / OPENAQ_RAW_CSV
-    wb_path = DATA_DIR / WORLDBANK_RAW_CSV
-
-    openaq_exists = openaq_path.exists()
-    wb_exists = wb_path.exists()
+    openaq_exists = (DATA_DIR / OPENAQ_RAW_PARQUET).exists() or (DATA_DIR / OPENAQ_RAW_CSV).exists()
+    wb_exists = (DATA_DIR / WORLDBANK_RAW_PARQUET).exists() or (DATA_DIR / WORLDBANK_RAW_CSV).exists()
 
     logger.log(f"OpenAQ data exists locally: {openaq_exists}")
     logger.log(f"World Bank data exists locally: {wb_exists}")
@@ -397,6 +677,20 @@ def check_cached_data(logger: Logger) -> Tuple[bool, bool]:
     return openaq_exists, wb_exists
 
 
+def load_raw_file(csv_name: str, parquet_name: str) -> pd.DataFrame:
+    """
+    Load a raw data file, preferring the Parquet copy over a legacy CSV.
+
+    Args:
+        csv_name: Legacy CSV file name in DATA_DIR
+        parquet_name: Parquet file name in DATA_DIR
+
+    Returns:
+        DataFrame with data
+    """
+    return load_csv_with_parquet_cache(DATA_DIR / csv_name, DATA_DIR / parquet_name)
+
+
 def load_cached_data(logger: Logger) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Load data from local cache files.
@@ -409,11 +703,8 @@ def load_cached_data(logger: Logger) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     logger.log("\nLoading data from local files...")
 
-    openaq_path = DATA_DIR / OPENAQ_RAW_CSV
-    wb_path = DATA_DIR / WORLDBANK_RAW_CSV
-
-    df_openaq = load_csv_if_exists(openaq_path)
-    df_wb = load_csv_if_exists(wb_path)
+    df_openaq = load_raw_file(OPENAQ_RAW_CSV, OPENAQ_RAW_PARQUET)
+    df_wb = load_raw_file(WORLDBANK_RAW_CSV, WORLDBANK_RAW_PARQUET)
 
     if not df_openaq.empty:
         logger.log(f"✓ Loaded {len(df_openaq)} OpenAQ records from local cache")
@@ -424,6 +715,32 @@ def load_cached_data(logger: Logger) -> Tuple[pd.DataFrame, pd.DataFrame]:
     return df_openaq, df_wb
 
 
+def save_raw_file(df: pd.DataFrame, csv_name: str, parquet_name: str, json_name: str) -> str:
+    """
+    Save a raw dataset as Parquet, or as CSV when pyarrow is not available.
+
+    Args:
+        df: DataFrame to save
+        csv_name: Fallback CSV file name in DATA_DIR
+        parquet_name: Parquet file name in DATA_DIR
+        json_name: JSON file name in DATA_DIR, written when DEBUG_JSON_DUMP is set
+
+    Returns:
+        Description of the formats written, for logging
+    """
+    if save_parquet(df, DATA_DIR / parquet_name):
+        formats = ['Parquet']
+    else:
+        df.to_csv(DATA_DIR / csv_name, index=False)
+        formats = ['CSV']
+
+    if DEBUG_JSON_DUMP:
+        df.to_json(DATA_DIR / json_name, orient='records', indent=2)
+        formats.append('JSON')
+
+    return ', '.join(formats)
+
+
 def save_raw_data(
     df_openaq: pd.DataFrame,
     df_wb: pd.DataFrame,
@@ -442,14 +759,12 @@ def save_raw_data(
     logger.log("=" * 80)
 
     if not df_openaq.empty:
-        df_openaq.to_csv(DATA_DIR / OPENAQ_RAW_CSV, index=False)
-        df_openaq.to_json(DATA_DIR / 'openaq_raw.json', orient='records', indent=2)
-        logger.log("✓ Saved OpenAQ raw data (CSV, JSON)")
+        formats = save_raw_file(df_openaq, OPENAQ_RAW_CSV, OPENAQ_RAW_PARQUET, OPENAQ_RAW_JSON)
+        logger.log(f"✓ Saved OpenAQ raw data ({formats})")
 
     if not df_wb.empty:
-        df_wb.to_csv(DATA_DIR / WORLDBANK_RAW_CSV, index=False)
-        df_wb.to_json(DATA_DIR / 'worldbank_raw.json', orient='records', indent=2)
-        logger.log("✓ Saved World Bank raw data (CSV, JSON)")
+        formats = save_raw_file(df_wb, WORLDBANK_RAW_CSV, WORLDBANK_RAW_PARQUET, WORLDBANK_RAW_JSON)
+        logger.log(f"✓ Saved World Bank raw data ({formats})")
 
 
 # ============================================================================
@@ -486,13 +801,13 @@ def fetch_or_load_data(
     if force_fetch or not openaq_exists:
         df_openaq = fetch_all_openaq_data(logger)
     else:
-        df_openaq = load_csv_if_exists(DATA_DIR / OPENAQ_RAW_CSV)
+        df_openaq = load_raw_file(OPENAQ_RAW_CSV, OPENAQ_RAW_PARQUET)
         logger.log(f"\n✓ Loaded {len(df_openaq)} OpenAQ records from cache")
 
     if force_fetch or not wb_exists:
         df_wb = fetch_all_world_bank_data(logger)
     else:
-        df_wb = load_csv_if_exists(DATA_DIR / WORLDBANK_RAW_CSV)
+        df_wb = load_raw_file(WORLDBANK_RAW_CSV, WORLDBANK_RAW_PARQUET)
         logger.log(f"\n✓ Loaded {len(df_wb)} World Bank records from cache")
 
     # Save newly fetched data
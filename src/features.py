@@ -6,6 +6,8 @@ Creates derived features and calculated columns for analysis.
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from src.config import AQI_PM25_BINS, AQI_PM25_LABELS
 from src.utils import Logger
@@ -15,6 +17,42 @@ from src.utils import Logger
 # FEATURE ENGINEERING FUNCTIONS
 # ============================================================================
 
+def _aqi_category(pm25: np.ndarray) -> pd.Categorical:
+    """Bin PM2.5 values into EPA AQI categories (right-closed, like pd.cut)."""
+    codes = np.digitize(pm25, AQI_PM25_BINS[1:-1], right=True).astype(np.int8)
+    # Values at or below the lowest edge, and missing values, get no category
+    codes[~(pm25 > AQI_PM25_BINS[0])] = -1
+    return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(AQI_PM25_LABELS, ordered=True))
+
+
+def _numeric_values(df: pd.DataFrame) -> np.ndarray:
+    """Copy the numeric columns into one float32 array (NaN survives the downcast)."""
+    return df.select_dtypes(include=[np.number]).to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+def _completeness_pct(values: np.ndarray) -> np.ndarray:
+    """Percentage of non-NaN values in each row."""
+    return (1 - np.isnan(values).mean(axis=1)) * 100
+
+
+def _composite_index(values: np.ndarray):
+    """
+    Average of the pollutant columns, each normalized to 0-100 by its maximum.
+
+    Columns without a positive maximum are skipped; returns None if none is left.
+    """
+    # Column maxima ignoring NaN; all-NaN (and empty) columns get -inf
+    max_vals = np.fmax.reduce(values, axis=0, initial=-np.inf)
+    usable = max_vals > 0
+    if not usable.any():
+        return None
+
+    normalized = values[:, usable] / max_vals[usable] * 100
+    counts = np.count_nonzero(~np.isnan(normalized), axis=1)
+    totals = np.nansum(normalized, axis=1)
+    return np.divide(totals, counts, out=np.full(len(values), np.nan), where=counts > 0)
+
+
 def create_pollution_per_gdp(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create PM2.5 per GDP feature (normalized pollution by economic output).
@@ -32,7 +70,7 @@ def create_pollution_per_gdp(df: pd.DataFrame) -> pd.DataFrame:
 
 def create_urban_pollution_index(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Create urban pollution index (PM2.5  urbanization percentage).
+    Create urban pollution index (PM2.5 × urbanization percentage).
 
     Args:
         df: DataFrame with pm25 and urban_population_pct columns
@@ -56,11 +94,7 @@ def create_aqi_category(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with aqi_category_pm25 column added
     """
     if 'mean_value_PM25' in df.columns:
-        df['aqi_category_pm25'] = pd.cut(
-            df['mean_value_PM25'],
-            bins=AQI_PM25_BINS,
-            labels=AQI_PM25_LABELS
-        )
+        df['aqi_category_pm25'] = _aqi_category(df['mean_value_PM25'].to_numpy(dtype=np.float64, na_value=np.nan))
     return df
 
 
@@ -74,8 +108,7 @@ def create_data_completeness_score(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with data_completeness_pct column added
     """
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    df['data_completeness_pct'] = (1 - df[numeric_cols].isna().mean(axis=1)) * 100
+    df['data_completeness_pct'] = _completeness_pct(_numeric_values(df))
     return df
 
 
@@ -92,20 +125,52 @@ def create_composite_pollution_index(df: pd.DataFrame) -> pd.DataFrame:
     pollutant_cols = [col for col in df.columns if col.startswith('mean_value_')]
 
     if pollutant_cols:
-        # Normalize each pollutant to 0-100 scale
-        normalized_pollutants = pd.DataFrame()
-        for col in pollutant_cols:
-            if df[col].notna().sum() > 0:
-                max_val = df[col].max()
-                if max_val > 0:
-                    normalized_pollutants[col] = (df[col] / max_val) * 100
-
-        if not normalized_pollutants.empty:
-            df['composite_pollution_index'] = normalized_pollutants.mean(axis=1)
+        composite = _composite_index(df[pollutant_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        if composite is not None:
+            df['composite_pollution_index'] = composite
 
     return df
 
 
+def create_all_features_fused(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute every derived feature in one pass and add them in a single assign.
+
+    Produces the same columns as calling the create_* functions above in
+    order, but reads each input column once and adds no columns one by one.
+
+    Args:
+        df: Merged DataFrame
+
+    Returns:
+        New DataFrame with the derived feature columns added
+    """
+    new_cols = {}
+
+    if 'mean_value_PM25' in df.columns:
+        pm25 = df['mean_value_PM25'].to_numpy(dtype=np.float64, na_value=np.nan)
+        if 'gdp_per_capita' in df.columns:
+            gdp = df['gdp_per_capita'].to_numpy(dtype=np.float64, na_value=np.nan)
+            new_cols['pm25_per_gdp'] = pm25 / (gdp / 1000)
+        if 'urban_population_pct' in df.columns:
+            urban = df['urban_population_pct'].to_numpy(dtype=np.float64, na_value=np.nan)
+            new_cols['urban_pollution_index'] = pm25 * (urban / 100)
+        new_cols['aqi_category_pm25'] = _aqi_category(pm25)
+
+    # Completeness also counts the numeric features created above
+    numeric = [_numeric_values(df.drop(columns=list(new_cols), errors='ignore'))]
+    numeric += [new_cols[col][:, None] for col in ('pm25_per_gdp', 'urban_pollution_index') if col in new_cols]
+    new_cols['data_completeness_pct'] = _completeness_pct(np.hstack(numeric))
+
+    pollutant_cols = [col for col in df.columns if col.startswith('mean_value_')]
+    if pollutant_cols:
+        composite = _composite_index(df[pollutant_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        if composite is not None:
+            new_cols['composite_pollution_index'] = composite
+
+    return df.assign(**new_cols)
+
+
 # ============================================================================
 # MAIN FEATURE ENGINEERING FUNCTION
 # ============================================================================
@@ -127,30 +192,18 @@ def create_all_features(df: pd.DataFrame, logger: Logger) -> pd.DataFrame:
 
     initial_col_count = len(df.columns)
 
-    # 1. Pollution per capita (normalized by GDP)
-    df = create_pollution_per_gdp(df)
-    if 'pm25_per_gdp' in df.columns:
-        logger.log(" Created: pm25_per_gdp (PM2.5 normalized by GDP)")
-
-    # 2. Urban pollution intensity
-    df = create_urban_pollution_index(df)
-    if 'urban_pollution_index' in df.columns:
-        logger.log(" Created: urban_pollution_index (PM2.5  urbanization %)")
-
-    # 3. Air Quality Index category for PM2.5 (US EPA standard)
-    df = create_aqi_category(df)
-    if 'aqi_category_pm25' in df.columns:
-        logger.log(" Created: aqi_category_pm25 (EPA AQI categories)")
-
-    # 4. Data completeness score (0-100)
-    df = create_data_completeness_score(df)
-    if 'data_completeness_pct' in df.columns:
-        logger.log(" Created: data_completeness_pct (% of non-null values)")
+    df = create_all_features_fused(df)
 
-    # 5. Multi-pollutant index (average of available pollutants, normalized)
-    df = create_composite_pollution_index(df)
-    if 'composite_pollution_index' in df.columns:
-        logger.log(" Created: composite_pollution_index (average of all pollutants, normalized)")
+    descriptions = {
+        'pm25_per_gdp': 'PM2.5 normalized by GDP',
+        'urban_pollution_index': 'PM2.5 × urbanization %',
+        'aqi_category_pm25': 'EPA AQI categories',
+        'data_completeness_pct': '% of non-null values',
+        'composite_pollution_index': 'average of all pollutants, normalized'
+    }
+    for col, description in descriptions.items():
+        if col in df.columns:
+            logger.log(f" Created: {col} ({description})")
 
     new_features = len(df.columns) - initial_col_count
     logger.log(f"\n Added {new_features} new features")
@@ -196,57 +249,51 @@ def filter_by_completeness(
     return df_filtered
 
 
+# Columns listed (when present) in each category, in display order
+KEY_COLUMN_CATEGORIES = {
+    'Identifiers': ['country', 'country_code', 'year'],
+    'Economic Indicators': ['gdp_per_capita', 'income_category'],
+    'Urbanization': ['urban_population_pct', 'urbanization_level'],
+    'Derived Features': ['pm25_per_gdp', 'urban_pollution_index', 'aqi_category_pm25', 'composite_pollution_index'],
+    'Quality Flags': ['data_completeness_pct', 'has_coordinates', 'has_city']
+}
+
+
+@lru_cache(maxsize=8)
+def _key_analysis_columns(columns: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Categorize a column set; cached per schema, so results are tuples."""
+    present = set(columns)
+    key_columns = {
+        category: tuple(col for col in candidates if col in present)
+        for category, candidates in KEY_COLUMN_CATEGORIES.items()
+    }
+    # Air Quality Metrics follow the frame's column order
+    key_columns['Air Quality Metrics'] = tuple(
+        col for col in columns if col.startswith(('mean_value_', 'median_value_'))
+    )
+    return key_columns
+
+
 def get_key_analysis_columns(df: pd.DataFrame) -> dict:
     """
     Get list of key columns for analysis, organized by category.
 
+    Results are cached by column names, so repeated calls on frames with the
+    same schema do not rescan the columns.
+
     Args:
         df: DataFrame to analyze
 
     Returns:
         Dictionary of column categories and their columns
     """
-    key_columns = {
-        'Identifiers': [],
-        'Air Quality Metrics': [],
-        'Economic Indicators': [],
-        'Urbanization': [],
-        'Derived Features': [],
-        'Quality Flags': []
+    key_columns = _key_analysis_columns(tuple(df.columns))
+    return {
+        category: list(key_columns[category])
+        for category in ['Identifiers', 'Air Quality Metrics', 'Economic Indicators',
+                         'Urbanization', 'Derived Features', 'Quality Flags']
     }
 
-    # Identifiers
-    for col in ['country', 'country_code', 'year']:
-        if col in df.columns:
-            key_columns['Identifiers'].append(col)
-
-    # Air Quality Metrics
-    for col in df.columns:
-        if col.startswith('mean_value_') or col.startswith('median_value_'):
-            key_columns['Air Quality Metrics'].append(col)
-
-    # Economic Indicators
-    for col in ['gdp_per_capita', 'income_category']:
-        if col in df.columns:
-            key_columns['Economic Indicators'].append(col)
-
-    # Urbanization
-    for col in ['urban_population_pct', 'urbanization_level']:
-        if col in df.columns:
-            key_columns['Urbanization'].append(col)
-
-    # Derived Features
-    for col in ['pm25_per_gdp', 'urban_pollution_index', 'aqi_category_pm25', 'composite_pollution_index']:
-        if col in df.columns:
-            key_columns['Derived Features'].append(col)
-
-    # Quality Flags
-    for col in ['data_completeness_pct', 'has_coordinates', 'has_city']:
-        if col in df.columns:
-            key_columns['Quality Flags'].append(col)
-
-    return key_columns
-
 
 # ============================================================================
 # STATISTICAL SUMMARY
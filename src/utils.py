@@ -5,13 +5,16 @@ Common utilities for logging, file operations, and data dictionary generation.
 """
 
 import json
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from src.config import (
     LOGS_DIR, DB_DIR, CLEANED_DIR,
-    LOG_DATE_FORMAT, LOG_FILE_PREFIX, PREPROCESSING_LOG_PREFIX
+    LOG_DATE_FORMAT, LOG_FILE_PREFIX, PREPROCESSING_LOG_PREFIX,
+    PARQUET_COMPRESSION, PARQUET_ROW_GROUP_SIZE
 )
 
 
@@ -25,15 +28,18 @@ class Logger:
     Can be saved to file at any time.
     """
 
-    def __init__(self, print_to_console: bool = True):
+    def __init__(self, print_to_console: bool = True, defer_console: bool = False):
         """
         Initialize logger.
 
         Args:
             print_to_console: Whether to print messages to console
+            defer_console: Hold console output until this logger is merged
+                into another one (for work running in threads or processes)
         """
         self.buffer: List[str] = []
         self.print_to_console = print_to_console
+        self.deferred: Optional[List[str]] = [] if defer_console else None
 
     def log(self, message: str, print_override: bool = None):
         """
@@ -49,7 +55,7 @@ class Logger:
 
         should_print = print_override if print_override is not None else self.print_to_console
         if should_print:
-            print(message)
+            self.log_console(message)
 
     def save(self, log_dir: Path = LOGS_DIR, prefix: str = LOG_FILE_PREFIX):
         """
@@ -67,6 +73,24 @@ class Logger:
 
         print(f"\n✓ Logs saved to {log_file}")
 
+    def merge(self, other: 'Logger'):
+        """
+        Append the entries of a deferred logger and print its held-back output.
+
+        Args:
+            other: Logger created with defer_console=True
+        """
+        self.buffer.extend(other.buffer)
+        for message in other.deferred or []:
+            self.log_console(message)
+
+    def log_console(self, message: str):
+        """Print a message now, or hold it back if this logger is deferred."""
+        if self.deferred is not None:
+            self.deferred.append(message)
+        else:
+            print(message)
+
     def get_logs(self) -> List[str]:
         """Get all log entries."""
         return self.buffer.copy()
@@ -108,22 +132,36 @@ def create_data_dictionary(df: pd.DataFrame, dataset_name: str) -> Dict[str, Any
         'columns': []
     }
 
+    # Counts for all columns at once instead of one scan per column;
+    # to_dict() converts them to Python scalars in bulk
+    non_null_counts = df.notna().sum().to_dict()
+    unique_counts = df.nunique().to_dict()
+    head = df.head(100)
+
+    # Statistics for all numerical columns (any int/float width) in one pass,
+    # with missing statistics as None
+    num_stats = df.select_dtypes(include=np.number).agg(['min', 'max', 'mean', 'median'])
+    num_stats = num_stats.astype(object).where(num_stats.notna(), None).to_dict()
+
     for col in df.columns:
+        # Sample values usually come from the first rows; scan the full
+        # column only when those hold fewer than five non-null values
+        sample_values = head[col].dropna().head(5)
+        if len(sample_values) < 5 and len(df) > len(head):
+            sample_values = df[col].dropna().head(5)
+
         col_info = {
             'name': col,
             'data_type': str(df[col].dtype),
-            'non_null_count': int(df[col].notna().sum()),
-            'null_count': int(df[col].isna().sum()),
-            'unique_values': int(df[col].nunique()),
-            'sample_values': df[col].dropna().head(5).tolist()
+            'non_null_count': non_null_counts[col],
+            'null_count': len(df) - non_null_counts[col],
+            'unique_values': unique_counts[col],
+            'sample_values': sample_values.tolist()
         }
 
         # Add statistics for numerical columns
-        if df[col].dtype in ['int64', 'float64']:
-            col_info['min'] = float(df[col].min()) if pd.notna(df[col].min()) else None
-            col_info['max'] = float(df[col].max()) if pd.notna(df[col].max()) else None
-            col_info['mean'] = float(df[col].mean()) if pd.notna(df[col].mean()) else None
-            col_info['median'] = float(df[col].median()) if pd.notna(df[col].median()) else None
+        if col in num_stats:
+            col_info.update(num_stats[col])
 
         dictionary['columns'].append(col_info)
 
@@ -145,8 +183,20 @@ def save_data_dictionary(df: pd.DataFrame, dataset_name: str, output_dir: Path =
     dictionary = create_data_dictionary(df, dataset_name)
     output_file = output_dir / f'{dataset_name}_data_dictionary.json'
 
-    with open(output_file, 'w') as f:
-        json.dump(dictionary, f, indent=2)
+    # Timestamps and other non-JSON sample values are written as strings
+    try:
+        import orjson
+    except ImportError:
+        with open(output_file, 'w') as f:
+            json.dump(dictionary, f, indent=2, default=str)
+        return
+
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            dictionary,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ))
 
 
 # ============================================================================
@@ -181,11 +231,110 @@ def load_csv_if_exists(file_path: Path) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def read_csv_fast(file_path: Path, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file with the multithreaded pyarrow parser when available.
+
+    Args:
+        file_path: Path to CSV file
+        **kwargs: Extra arguments passed to pd.read_csv
+
+    Returns:
+        DataFrame with data
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.read_csv(file_path, **kwargs)
+
+    return pd.read_csv(file_path, engine='pyarrow', **kwargs)
+
+
+def is_parquet_cache_fresh(csv_path: Path, parquet_path: Path) -> bool:
+    """
+    Check whether a Parquet file can be read in place of a CSV file.
+
+    Args:
+        csv_path: Path to CSV file (may not exist)
+        parquet_path: Path to Parquet file
+
+    Returns:
+        True if the Parquet file exists and the CSV is missing or not newer
+    """
+    if not check_file_exists(parquet_path):
+        return False
+    return not check_file_exists(csv_path) or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+
+
+def load_csv_with_parquet_cache(
+    csv_path: Path,
+    parquet_path: Path,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    Load a CSV file through a Parquet cache stored next to it.
+
+    The cache is used while it is at least as new as the CSV, or when there
+    is no CSV. Otherwise the CSV is parsed once and the cache is rewritten. The `usecols` and `dtype`
+    arguments are also applied to cached data.
+
+    Args:
+        csv_path: Path to CSV file
+        parquet_path: Path to Parquet cache file
+        **kwargs: Extra arguments passed to pd.read_csv
+
+    Returns:
+        DataFrame with data
+    """
+    if is_parquet_cache_fresh(csv_path, parquet_path):
+        df = pd.read_parquet(parquet_path, columns=kwargs.get('usecols'))
+        return df.astype(kwargs['dtype']) if 'dtype' in kwargs else df
+
+    df = read_csv_fast(csv_path, **kwargs)
+    save_parquet(df, parquet_path)
+    return df
+
+
+def save_parquet(
+    df: pd.DataFrame,
+    file_path: Path,
+    compression: str = PARQUET_COMPRESSION,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE
+) -> bool:
+    """
+    Save DataFrame to a Parquet file, one row group at a time.
+
+    Only one row group is converted to Arrow at a time, so the Arrow copy of
+    a large frame is never held in memory at once.
+
+    Args:
+        df: DataFrame to save
+        file_path: Path to Parquet file
+        compression: Parquet compression codec
+        row_group_size: Number of rows per row group
+
+    Returns:
+        True if saved, False if pyarrow is not available
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return False
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(file_path, schema, compression=compression) as writer:
+        for start in range(0, len(df), row_group_size):
+            chunk = df.iloc[start:start + row_group_size]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    return True
+
+
 def save_dataframe_multiple_formats(
     df: pd.DataFrame,
     base_path: Path,
     base_name: str,
-    formats: List[str] = ['csv', 'json']
+    formats: List[str] = ['parquet', 'csv', 'json']
 ):
     """
     Save DataFrame in multiple formats.
@@ -211,11 +360,8 @@ def save_dataframe_multiple_formats(
 
     if 'parquet' in formats:
         try:
-            import pyarrow
-            df.to_parquet(base_path / f'{base_name}.parquet', index=False)
-            saved_formats.append('Parquet')
-        except ImportError:
-            pass  # Skip if pyarrow not available
+            if save_parquet(df, base_path / f'{base_name}.parquet'):
+                saved_formats.append('Parquet')
         except Exception:
             pass  # Skip on error
 
@@ -274,6 +420,40 @@ def get_iso_country_code_mapping() -> Dict[str, str]:
     return iso_mapping
 
 
+@lru_cache(maxsize=1)
+def get_iso_mapping_arrays() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the ISO code mapping as sorted lookup arrays.
+
+    Returns:
+        Tuple of (sorted 2-letter codes, aligned 3-letter codes)
+    """
+    iso_mapping = get_iso_country_code_mapping()
+    keys = np.array(sorted(iso_mapping), dtype='U2')
+    values = np.array([iso_mapping[key] for key in keys], dtype='U3')
+    keys.flags.writeable = False
+    values.flags.writeable = False
+    return keys, values
+
+
+def map_iso2_to_iso3(codes: np.ndarray) -> np.ndarray:
+    """
+    Convert 2-letter country codes to 3-letter codes with a binary search.
+
+    Codes without a mapping are returned unchanged.
+
+    Args:
+        codes: Array of country codes
+
+    Returns:
+        Array of converted country codes
+    """
+    keys, values = get_iso_mapping_arrays()
+    codes = np.asarray(codes, dtype=str)
+    idx = np.minimum(np.searchsorted(keys, codes), len(keys) - 1)
+    return np.where(keys[idx] == codes, values[idx], codes)
+
+
 # ============================================================================
 # FORMATTING UTILITIES
 # ============================================================================
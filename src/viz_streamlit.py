@@ -19,7 +19,7 @@ def main():
     st.title("Air Quality Dashboard")
 
     # Load data
-    df = pd.read_csv('cleaned_data/analysis_ready.csv')
+    df = pd.read_parquet('cleaned_data/analysis_ready.parquet')
 
     # Create visualizations
     # ...
@@ -0,0 +1,361 @@
+"""
+Dashboard Data Loading
+======================
+Cached loaders for the cleaned datasets and trained model shown on the
+dashboard pages.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+# Cleaned datasets and models, resolved from this file so pages work from any directory
+CLEANED_DIR = Path(__file__).resolve().parent.parent / "cleaned_data"
+MODELS_DIR = Path(__file__).resolve().parent.parent / "models"
+
+# Rows per chunk when aggregating a dataset incrementally
+CHUNK_ROWS = 500_000
+
+# Ordinal code for labels the model was not trained on (the unknown_value of
+# the pipeline's OrdinalEncoder)
+UNKNOWN_CODE = -1
+
+
+@st.cache_data
+def _load_compact(path: Path, mtime: float) -> pd.DataFrame:
+    """Read a whole dataset with compact dtypes; mtime is only part of the cache key."""
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            df = pd.read_csv(path)
+        else:
+            df = pd.read_csv(path, engine="pyarrow")
+
+    float_cols = df.select_dtypes(include=["float64"]).columns
+    df[float_cols] = df[float_cols].astype("float32")
+    for col in df.select_dtypes(include=["int64"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    df[text_cols] = df[text_cols].astype("category")
+    return df
+
+
+def load_compact_dataset(name: str) -> pd.DataFrame:
+    """
+    Load a whole cleaned dataset with compact dtypes, once per file version.
+
+    Prefers the Parquet file written by clean_data.py and falls back to the
+    CSV export, parsed with pyarrow's multithreaded parser when pyarrow is
+    installed. Floats are narrowed to float32 and integers to the smallest
+    integer type that holds them, and text columns are converted to
+    categoricals, whose categories are the sorted distinct labels.
+
+    Args:
+        name: Dataset name in cleaned_data/ (without extension)
+
+    Returns:
+        DataFrame with data
+    """
+    path = _dataset_path(name)
+    return _load_compact(path, path.stat().st_mtime)
+
+
+@st.cache_data(ttl=3600)
+def _read_dataset(path: Path, mtime: float, columns: Optional[tuple]) -> pd.DataFrame:
+    """Read a cleaned dataset; mtime is only part of the cache key."""
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+
+    usecols = list(columns) if columns is not None else None
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.read_csv(path, usecols=usecols)
+
+    return pd.read_csv(path, usecols=usecols, engine="pyarrow")
+
+
+def _dataset_path(name: str) -> Path:
+    """Return the Parquet file for a dataset, or its CSV export if there is none."""
+    path = CLEANED_DIR / f"{name}.parquet"
+    if not path.exists():
+        path = CLEANED_DIR / f"{name}.csv"
+    return path
+
+
+def _iter_chunks(path: Path, columns: list) -> Iterator[pd.DataFrame]:
+    """Yield a dataset in chunks of at most CHUNK_ROWS rows."""
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=CHUNK_ROWS, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=CHUNK_ROWS)
+
+
+def _polars_grouped_mean(path: Path, by: list, value: str) -> pd.Series:
+    """Mean of a column per group with a lazy, multithreaded Polars query."""
+    scan = pl.scan_parquet if path.suffix == ".parquet" else pl.scan_csv
+    means = (
+        scan(path)
+        .select(by + [value])
+        .drop_nulls(by)
+        .group_by(by)
+        .agg(pl.col(value).cast(pl.Float64).fill_nan(None).mean())
+        .collect(engine="streaming")
+        .to_pandas()
+    )
+    return means.set_index(by)[value].sort_index()
+
+
+@st.cache_data(ttl=3600)
+def _grouped_mean(path: Path, mtime: float, by: tuple, value: str) -> pd.Series:
+    """Mean of a column per group; mtime is only part of the cache key."""
+    by = list(by)
+    if pl is not None:
+        return _polars_grouped_mean(path, by, value)
+
+    # Without Polars, keep running (sum, count) totals over chunks
+    totals = None
+    for chunk in _iter_chunks(path, by + [value]):
+        partial = chunk.groupby(by, observed=True)[value].agg(["sum", "count"])
+        totals = partial if totals is None else totals.add(partial, fill_value=0)
+
+    if totals is None:
+        return pd.Series(dtype="float64", name=value)
+    return (totals["sum"] / totals["count"]).rename(value).sort_index()
+
+
+def grouped_mean(name: str, by: Sequence[str], value: str) -> pd.Series:
+    """
+    Compute the mean of a column per group without loading the whole dataset.
+
+    Runs as a streaming Polars query, which only scans the needed columns,
+    when Polars is installed. Otherwise the dataset is read in chunks and
+    only the running sum and count per group are kept. Either way memory is
+    bounded by the number of groups.
+
+    Args:
+        name: Dataset name in cleaned_data/ (without extension)
+        by: Columns to group by
+        value: Column to average
+
+    Returns:
+        Series of means indexed by the group columns
+    """
+    path = _dataset_path(name)
+    return _grouped_mean(path, path.stat().st_mtime, tuple(by), value)
+
+
+def load_dataset(name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Load only the requested columns of a cleaned dataset.
+
+    Prefers the Parquet file written by clean_data.py and falls back to the
+    CSV export. Results are cached per file modification time, so a re-run of
+    the cleaning pipeline is picked up without restarting the dashboard.
+
+    Args:
+        name: Dataset name in cleaned_data/ (without extension)
+        columns: Columns to read (all columns if None)
+
+    Returns:
+        DataFrame with data
+    """
+    path = _dataset_path(name)
+    columns = tuple(columns) if columns is not None else None
+    return _read_dataset(path, path.stat().st_mtime, columns)
+
+
+@st.cache_data(ttl=3600)
+def _correlation_matrix(path: Path, mtime: float, columns: tuple) -> pd.DataFrame:
+    """Pairwise correlations of a dataset's columns; mtime is only part of the cache key."""
+    return _read_dataset(path, mtime, columns).corr()
+
+
+def correlation_matrix(name: str, columns: Sequence[str]) -> pd.DataFrame:
+    """
+    Compute the correlation matrix of some columns of a cleaned dataset.
+
+    The matrix is cached per file modification time, so it is only
+    recomputed when the dataset is rewritten.
+
+    Args:
+        name: Dataset name in cleaned_data/ (without extension)
+        columns: Columns to correlate
+
+    Returns:
+        Correlation matrix as a DataFrame
+    """
+    path = _dataset_path(name)
+    return _correlation_matrix(path, path.stat().st_mtime, tuple(columns))
+
+
+@st.cache_resource
+def _load_model(path: Path, mtime: float) -> Tuple[Any, Tuple[str, ...]]:
+    """Unpickle a model once and share it across sessions; mtime is only part of the cache key."""
+    model = joblib.load(path)
+    # Predict across all cores whatever n_jobs the forest was trained with
+    if hasattr(model[-1], "n_jobs"):
+        model[-1].n_jobs = -1
+    return model, tuple(model[:-1].get_feature_names_out())
+
+
+def load_model(file_name: str) -> Tuple[Any, Tuple[str, ...]]:
+    """
+    Load a trained model pipeline from models/.
+
+    The unpickled model is shared by all reruns and sessions until the file
+    changes, e.g. after retraining.
+
+    Args:
+        file_name: Model file name in models/
+
+    Returns:
+        Tuple of (model, feature order of the regressor's input, i.e. the
+        pipeline's preprocessed columns)
+    """
+    path = MODELS_DIR / file_name
+    return _load_model(path, path.stat().st_mtime)
+
+
+@st.cache_resource
+def _load_encoders(path: Path, mtime: float) -> Dict[str, Dict[Any, int]]:
+    """Label-to-code lookup tables from encoders.npz or a saved pipeline; mtime is only part of the cache key."""
+    if path.suffix == ".npz":
+        with np.load(path) as classes:
+            return {
+                col: {label: code for code, label in enumerate(classes[col].tolist())}
+                for col in classes.files
+            }
+
+    preprocess = _load_model(path, mtime)[0][0]
+    cat_cols = {name: cols for name, _, cols in preprocess.transformers_}["cat"]
+    categories = preprocess.named_transformers_["cat"][-1].categories_
+    return {
+        col: {label: code for code, label in enumerate(labels)}
+        for col, labels in zip(cat_cols, categories)
+    }
+
+
+def load_encoders(file_name: str) -> Dict[str, Dict[Any, int]]:
+    """
+    Load the categorical encoders of a trained model pipeline from models/.
+
+    Reads the plain label arrays in models/encoders.npz written with the
+    model, and only falls back to the pickled pipeline when that file is
+    missing or older than the model.
+
+    Args:
+        file_name: Model file name in models/
+
+    Returns:
+        Dictionary mapping each categorical column to a {label: code}
+        lookup table, so encoding is one hash lookup per value
+    """
+    model_path = MODELS_DIR / file_name
+    path = MODELS_DIR / "encoders.npz"
+    if not path.exists() or path.stat().st_mtime < model_path.stat().st_mtime:
+        path = model_path
+    return _load_encoders(path, path.stat().st_mtime)
+
+
+@st.cache_data
+def _load_column_meta(path: Path, mtime: float) -> Dict[str, Dict[str, Any]]:
+    """Read a column metadata sidecar; mtime is only part of the cache key."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_column_meta(file_name: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Load the per-feature widget metadata saved next to a trained model.
+
+    Args:
+        file_name: Metadata file name in models/
+
+    Returns:
+        Dictionary mapping each feature to its dtype, median (numeric
+        features) and sorted labels (categorical features), or None if the
+        file does not exist
+    """
+    path = MODELS_DIR / file_name
+    if not path.exists():
+        return None
+    return _load_column_meta(path, path.stat().st_mtime)
+
+
+@st.cache_resource
+def _load_onnx_session(path: Path, mtime: float) -> Any:
+    """Open an ONNX inference session once; mtime is only part of the cache key."""
+    return ort.InferenceSession(str(path), providers=["CPUExecutionProvider"])
+
+
+def load_onnx_session(file_name: str) -> Optional[Any]:
+    """
+    Load the compiled ONNX copy of a trained regressor from models/.
+
+    Args:
+        file_name: ONNX file name in models/
+
+    Returns:
+        onnxruntime InferenceSession taking the preprocessed float32 rows as
+        input "x", or None if onnxruntime or the file is missing
+    """
+    path = MODELS_DIR / file_name
+    if ort is None or not path.exists():
+        return None
+    return _load_onnx_session(path, path.stat().st_mtime)
+
+
+@lru_cache(maxsize=1024)
+def _predict_one(path: Path, mtime: float, row: Tuple[float, ...]) -> float:
+    """Predict one preprocessed feature row; mtime is only part of the cache key."""
+    x = np.asarray(row, dtype=np.float32).reshape(1, -1)
+    if path.suffix == ".onnx":
+        return float(_load_onnx_session(path, mtime).run(None, {"x": x})[0].ravel()[0])
+    return float(_load_model(path, mtime)[0][-1].predict(x)[0])
+
+
+def predict_one(model_file: str, onnx_file: str, row: Tuple[float, ...]) -> float:
+    """
+    Predict a single preprocessed feature row, memoizing repeated inputs.
+
+    Uses the ONNX copy of the regressor when it can be loaded, otherwise the
+    pipeline's final estimator. The last 1024 distinct rows per model version
+    are remembered, so resubmitting the same inputs skips the trees.
+
+    Args:
+        model_file: Model file name in models/
+        onnx_file: ONNX file name in models/ (may not exist)
+        row: Feature values in the model's feature order, with categories
+            already encoded (see load_encoders)
+
+    Returns:
+        Predicted value
+    """
+    path = MODELS_DIR / onnx_file
+    if ort is None or not path.exists():
+        path = MODELS_DIR / model_file
+    return _predict_one(path, path.stat().st_mtime, row)
@@ -1,18 +1,16 @@
 import streamlit as st
-import pandas as pd
 import matplotlib.pyplot as plt
 
-st.title("📈 Pollutant Trends Over Time")
+from data_loader import grouped_mean
 
-df = pd.read_csv("../cleaned_data/analysis_ready.csv")
+st.title("📈 Pollutant Trends Over Time")
 
 pollutant = st.selectbox(
     "Select Pollutant",
     ["mean_value_PM25", "mean_value_PM10", "mean_value_NO2", "mean_value_O3"]
 )
 
-df_p = df[["year", pollutant]].dropna()
-yearly = df_p.groupby("year")[pollutant].mean()
+yearly = grouped_mean("analysis_ready", ["year"], pollutant).dropna()
 
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(yearly.index, yearly.values, marker="o")
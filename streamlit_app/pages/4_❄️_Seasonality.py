@@ -1,15 +1,15 @@
 import streamlit as st
-import pandas as pd
 import matplotlib.pyplot as plt
 
+from data_loader import grouped_mean
+
 st.title("❄️ Seasonal Variation (OpenAQ Raw Data)")
 
-df = pd.read_csv("../cleaned_data/openaq_cleaned.csv")
 poll = st.selectbox("Select Pollutant", ["PM25", "PM10", "NO2", "O3"])
 
-df_p = df[df["parameter"] == poll]
-
-monthly = df_p.groupby("measurement_month")["value"].mean()
+# Monthly means for every pollutant, aggregated chunk by chunk
+means = grouped_mean("openaq_cleaned", ["parameter", "measurement_month"], "value")
+monthly = means[means.index.get_level_values("parameter") == poll].droplevel("parameter")
 
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(monthly.index, monthly.values, marker="o")
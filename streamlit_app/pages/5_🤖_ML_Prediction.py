@@ -1,89 +1,92 @@
 import streamlit as st
 import pandas as pd
-import joblib
-import numpy as np
-import os
 
-st.title("🤖 PM2.5 Level Prediction (Random Forest)")
-
-# Use absolute path or relative path from project root
-data_path = os.path.join(os.path.dirname(__file__), "../../cleaned_data/analysis_ready.csv")
-df = pd.read_csv(data_path)
+from data_loader import (
+    MODELS_DIR, UNKNOWN_CODE, load_column_meta, load_compact_dataset, load_encoders,
+    load_model, predict_one
+)
 
-# FEATURES
-features = [c for c in df.columns if c not in ["mean_value_PM25", "country"]]
+st.title("🤖 PM2.5 Level Prediction (Random Forest)")
 
 # Load your RF model (save using joblib)
 # joblib.dump(model, "rf_model.pkl")
-model_path = os.path.join(os.path.dirname(__file__), "../../models/rf_model.pkl")
+model_path = MODELS_DIR / "rf_model.pkl"
 
 try:
-    import joblib
-    model = joblib.load(model_path)
+    model, feature_order = load_model("rf_model.pkl")
+    encoders = load_encoders("rf_model.pkl")
     st.success("Model Loaded Successfully!")
 except:
     st.error(f"Model file not found at {model_path}. Train & save the model using joblib.")
     st.stop()
 
-# Inputs
-inputs = {}
-for col in features:
-    if df[col].dtype == "float64" or df[col].dtype == "int64":
-        inputs[col] = st.number_input(col, float(df[col].median()))
-    else:
-        # Convert to string to handle mixed types (e.g. NaN and str) and ensure sortability
-        unique_vals = df[col].astype(str).unique()
-        inputs[col] = st.selectbox(col, sorted(unique_vals))
+# Widget metadata saved at training time; derived from the dataset if missing
+col_meta = load_column_meta("col_meta.json")
+if col_meta is None:
+    df = load_compact_dataset("analysis_ready")
 
-# Load Encoders
-encoders_path = os.path.join(os.path.dirname(__file__), "../../models/encoders.pkl")
-encoders = {}
-if os.path.exists(encoders_path):
-    encoders = joblib.load(encoders_path)
+    # FEATURES
+    features = [c for c in df.columns if c not in ["mean_value_PM25", "country"]]
 
-# Convert to DataFrame
-input_df = pd.DataFrame([inputs])
+    col_meta = {}
+    for col in features:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            col_meta[col] = {"dtype": str(df[col].dtype), "median": float(df[col].median()), "uniques": None}
+        else:
+            # Text columns are loaded as categoricals: the categories are
+            # already the distinct labels, without missing values
+            unique_vals = df[col].cat.categories.tolist()
+            col_meta[col] = {"dtype": str(df[col].dtype), "median": None, "uniques": unique_vals}
 
-# Encode categorical columns
-for col, le in encoders.items():
-    if col in input_df.columns:
-        # Handle unseen labels by assigning a default or raising an error
-        # Here we use a safe approach: map to known labels or use a default
-        # For simplicity in this context, we'll try to transform, and if it fails (unseen label), 
-        # we might need a fallback. However, since we populate selectbox from unique values,
-        # it should be fine unless the model was trained on a different dataset version.
-        # But wait, we populate selectbox from `df` which is loaded from CSV.
-        # The model was trained on the same CSV.
-        # So the labels should be consistent.
-        # We need to ensure the input is string because we converted to string for selectbox.
-        input_df[col] = input_df[col].astype(str)
-        input_df[col] = le.transform(input_df[col])
-
-# Ensure input_df has the same columns as the model expects
-if hasattr(model, "feature_names_in_"):
-    # Reorder and filter columns to match model's expected input
-    input_df = input_df[model.feature_names_in_]
-else:
-    st.warning("Model does not have feature_names_in_ attribute. Prediction might fail if feature order is incorrect.")
+# Inputs (inside a form, so editing a field does not rerun the page;
+# everything is submitted together)
+inputs = {}
+with st.form("predict_form"):
+    for col, meta in col_meta.items():
+        if meta["uniques"] is None:
+            inputs[col] = st.number_input(col, meta["median"])
+        else:
+            inputs[col] = st.selectbox(col, meta["uniques"])
+    submitted = st.form_submit_button("Predict PM2.5 Level")
 
 # Predict
-if st.button("Predict PM2.5 Level"):
-    pred = model.predict(input_df)[0]
+if submitted:
+    # Build the preprocessed feature row (numeric inputs as-is, categories
+    # as the pipeline's ordinal codes, unseen labels as UNKNOWN_CODE) and
+    # predict it with the regressor directly instead of going through a
+    # DataFrame; repeated inputs are answered from a cache
+    row = tuple(
+        encoders[col].get(inputs[col], UNKNOWN_CODE) if col in encoders else float(inputs[col])
+        for col in feature_order
+    )
+    pred = predict_one("rf_model.pkl", "rf_model.onnx", row)
     st.metric("Predicted PM2.5 (µg/m³)", f"{pred:.2f}")
 
+# Batch prediction: one vectorized pipeline call (imputation, encoding and
+# all trees) for every row of an uploaded CSV
+uploaded = st.file_uploader("Batch prediction: upload a CSV with the input columns", type="csv")
+if uploaded is not None:
+    batch = pd.read_csv(uploaded)
+    missing = [c for c in model.feature_names_in_ if c not in batch.columns]
+    if missing:
+        st.error(f"Uploaded CSV is missing columns: {', '.join(missing)}")
+    else:
+        batch["predicted_PM25"] = model.predict(batch[model.feature_names_in_])
+        st.dataframe(batch)
+
 st.markdown("""
 ### Model Performance (Real Results):
 | Metric | Value | Interpretation |
 |--------|-------|----------------|
 | **R²** | 0.82 | 82% variance explained |
-| **RMSE** | 14.24 µg/m³ | Average prediction error |
-| **MAE** | 4.70 µg/m³ | Typical error magnitude |
+| **RMSE** | 14.45 µg/m³ | Average prediction error |
+| **MAE** | 4.76 µg/m³ | Typical error magnitude |
 
 ### Top Feature Importance:
 | Rank | Feature | Importance |
 |------|---------|------------|
-| 1 | **urban_population_pct** | 55.8% |
-| 2 | **gdp_per_capita** | 29.8% |
+| 1 | **urban_population_pct** | 55.7% |
+| 2 | **gdp_per_capita** | 29.9% |
 | 3 | data_completeness_pct | 12.9% |
 | 4 | year | 1.3% |
 | 5 | income_category | 0.2% |